@@ -41,7 +41,7 @@ resource "aws_iam_role_policy" "init_job" {
     Statement = [
       {
         Effect = "Allow"
-        Action = ["dynamodb:PutItem", "dynamodb:GetItem", "dynamodb:Query"]
+        Action = ["dynamodb:PutItem", "dynamodb:BatchWriteItem", "dynamodb:GetItem", "dynamodb:Query"]
         Resource = [
           aws_dynamodb_table.orders.arn,
           "${aws_dynamodb_table.orders.arn}/index/*",
@@ -56,7 +56,7 @@ resource "aws_iam_role_policy" "init_job" {
       },
       {
         Effect   = "Allow"
-        Action   = ["ssm:GetParameter"]
+        Action   = ["ssm:GetParameter", "ssm:GetParameters"]
         Resource = "arn:aws:ssm:${local.region}:${local.account_id}:parameter/*"
       },
       {
@@ -69,6 +69,12 @@ resource "aws_iam_role_policy" "init_job" {
         Action   = ["secretsmanager:GetSecretValue"]
         Resource = "arn:aws:secretsmanager:${local.region}:${local.account_id}:secret:*"
       },
+      {
+        # Authorized per call; each secret still needs GetSecretValue
+        Effect   = "Allow"
+        Action   = ["secretsmanager:BatchGetSecretValue"]
+        Resource = "*"
+      },
     ]
   })
 }
@@ -96,9 +102,11 @@ resource "aws_iam_role_policy" "orchestrator" {
     Version = "2012-10-17"
     Statement = [
       {
+        # TransactWriteItems is authorized per item: PutItem and UpdateItem
         Effect = "Allow"
         Action = [
           "dynamodb:PutItem",
+          "dynamodb:BatchWriteItem",
           "dynamodb:GetItem",
           "dynamodb:Query",
           "dynamodb:UpdateItem",
@@ -120,6 +128,23 @@ resource "aws_iam_role_policy" "orchestrator" {
           "${aws_s3_bucket.done.arn}/*",
         ]
       },
+      {
+        Effect = "Allow"
+        Action = [
+          "sqs:ReceiveMessage",
+          "sqs:DeleteMessage",
+          "sqs:GetQueueAttributes",
+        ]
+        Resource = aws_sqs_queue.orchestrator_trigger.arn
+      },
+      {
+        Effect   = "Allow"
+        Action   = ["s3:ListBucket"]
+        Resource = aws_s3_bucket.internal.arn
+        Condition = {
+          StringLike = { "s3:prefix" = ["tmp/callbacks/runs/*"] }
+        }
+      },
       {
         Effect   = "Allow"
         Action   = ["lambda:InvokeFunction"]
@@ -314,7 +339,7 @@ resource "aws_iam_role_policy" "ssm_config" {
     Statement = [
       {
         Effect = "Allow"
-        Action = ["dynamodb:PutItem", "dynamodb:GetItem", "dynamodb:Query"]
+        Action = ["dynamodb:PutItem", "dynamodb:BatchWriteItem", "dynamodb:GetItem", "dynamodb:Query"]
         Resource = [
           aws_dynamodb_table.orders.arn,
           aws_dynamodb_table.order_events.arn,
@@ -328,7 +353,7 @@ resource "aws_iam_role_policy" "ssm_config" {
       },
       {
         Effect   = "Allow"
-        Action   = ["ssm:GetParameter"]
+        Action   = ["ssm:GetParameter", "ssm:GetParameters"]
         Resource = "arn:aws:ssm:${local.region}:${local.account_id}:parameter/*"
       },
       {
@@ -336,6 +361,12 @@ resource "aws_iam_role_policy" "ssm_config" {
         Action   = ["secretsmanager:GetSecretValue"]
         Resource = "arn:aws:secretsmanager:${local.region}:${local.account_id}:secret:*"
       },
+      {
+        # Authorized per call; each secret still needs GetSecretValue
+        Effect   = "Allow"
+        Action   = ["secretsmanager:BatchGetSecretValue"]
+        Resource = "*"
+      },
     ]
   })
 }
@@ -1,20 +1,54 @@
-resource "aws_lambda_permission" "s3_invoke_orchestrator" {
-  statement_id  = "AllowS3Invoke"
-  action        = "lambda:InvokeFunction"
-  function_name = aws_lambda_function.orchestrator.function_name
-  principal     = "s3.amazonaws.com"
-  source_arn    = aws_s3_bucket.internal.arn
+# Callback writes go through an SQS queue so the orchestrator receives them
+# in batches: several result.json writes for the same run inside the
+# batching window become one invocation instead of N lock contenders.
+# (S3 notifications can't target FIFO queues, so this is a standard queue;
+# the handler dedupes run_ids within a batch.)
+
+resource "aws_sqs_queue" "orchestrator_trigger" {
+  name                       = "${local.prefix}-orchestrator-trigger"
+  visibility_timeout_seconds = 3600 # >= 6x the orchestrator timeout
+  message_retention_seconds  = 86400
+}
+
+resource "aws_sqs_queue_policy" "orchestrator_trigger" {
+  queue_url = aws_sqs_queue.orchestrator_trigger.id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect    = "Allow"
+        Principal = { Service = "s3.amazonaws.com" }
+        Action    = "sqs:SendMessage"
+        Resource  = aws_sqs_queue.orchestrator_trigger.arn
+        Condition = {
+          ArnEquals = { "aws:SourceArn" = aws_s3_bucket.internal.arn }
+        }
+      },
+    ]
+  })
 }
 
 resource "aws_s3_bucket_notification" "orchestrator_trigger" {
   bucket = aws_s3_bucket.internal.id
 
-  lambda_function {
-    lambda_function_arn = aws_lambda_function.orchestrator.arn
-    events              = ["s3:ObjectCreated:*"]
-    filter_prefix       = "tmp/callbacks/runs/"
-    filter_suffix       = "result.json"
+  queue {
+    queue_arn     = aws_sqs_queue.orchestrator_trigger.arn
+    events        = ["s3:ObjectCreated:*"]
+    filter_prefix = "tmp/callbacks/runs/"
+    filter_suffix = "result.json"
   }
 
-  depends_on = [aws_lambda_permission.s3_invoke_orchestrator]
+  depends_on = [aws_sqs_queue_policy.orchestrator_trigger]
+}
+
+resource "aws_lambda_event_source_mapping" "orchestrator_trigger" {
+  event_source_arn                   = aws_sqs_queue.orchestrator_trigger.arn
+  function_name                      = aws_lambda_function.orchestrator.arn
+  batch_size                         = 10
+  maximum_batching_window_in_seconds = 2
+
+  # The handler returns batchItemFailures for runs it skipped (lock held)
+  # or failed, so only those messages go back to the queue
+  function_response_types = ["ReportBatchItemFailures"]
 }
@@ -5,10 +5,12 @@ and credential sources. It merges everything into a flat dict, then hands
 it off to sops.repackage_order which stays generic.
 """
 
+import os
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from src.common import sops
+from src.common.code_source import detach_file
 
 
 @dataclass
@@ -41,27 +43,23 @@ class OrderBundler:
         Merge order: env_vars -> ssm_values -> secret_values -> engine fields.
         Later sources overwrite earlier ones on key collision.
         """
-        merged: Dict[str, str] = {}
-
-        # User-provided env vars
-        merged.update(self.env_vars)
-
-        # Credentials from SSM / Secrets Manager
-        merged.update(self.ssm_values)
-        merged.update(self.secret_values)
-
-        # Callback URL
+        # Callback URL + engine introspection fields
+        engine: Dict[str, str] = {}
         if self.callback_url:
-            merged["CALLBACK_URL"] = self.callback_url
-
-        # Engine introspection fields
-        merged["TRACE_ID"] = self.trace_id
-        merged["RUN_ID"] = self.run_id
-        merged["ORDER_ID"] = self.order_id
-        merged["ORDER_NUM"] = self.order_num
-        merged["FLOW_ID"] = self.flow_id
-
-        return merged
+            engine["CALLBACK_URL"] = self.callback_url
+        engine["TRACE_ID"] = self.trace_id
+        engine["RUN_ID"] = self.run_id
+        engine["ORDER_ID"] = self.order_id
+        engine["ORDER_NUM"] = self.order_num
+        engine["FLOW_ID"] = self.flow_id
+
+        # User env vars, then SSM / Secrets Manager credentials, in one build
+        return {
+            **self.env_vars,
+            **self.ssm_values,
+            **self.secret_values,
+            **engine,
+        }
 
     def secret_sources(self) -> List[str]:
         """Return sorted list of SSM/Secrets Manager key names that were fetched."""
@@ -73,8 +71,6 @@ class OrderBundler:
         Also writes secrets.src manifest listing credential source keys.
         Returns the code_dir path.
         """
-        import os
-
         env = self.build_env()
         result_dir = sops.repackage_order(code_dir, env, sops_key=sops_key)
 
@@ -82,8 +78,8 @@ class OrderBundler:
         sources = self.secret_sources()
         if sources:
             secrets_src = os.path.join(code_dir, "secrets.src")
-            with open(secrets_src, "w") as f:
-                for path in sources:
-                    f.write(f"{path}\n")
+            detach_file(secrets_src)
+            with open(secrets_src, "w", buffering=-1) as f:
+                f.write("\n".join(sources) + "\n")
 
         return result_dir
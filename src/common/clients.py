@@ -0,0 +1,36 @@
+"""Shared boto3 clients, created lazily and reused across calls."""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+# Pool sized for the thread pools that fan out S3 / SSM / Secrets Manager
+# calls; adaptive retries back off client-side when throttled. TCP
+# keepalive stops pooled connections idling between warm invocations from
+# being silently dropped, which would cost a fresh TLS handshake.
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(service: str, region: Optional[str] = None):
+    """Return a cached boto3 client for (service, region).
+
+    Clients are thread-safe once built, but creating them from boto3's
+    default session is not, so creation happens under a lock.
+    """
+    key = (service, region)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = boto3.client(
+                service, region_name=region, config=CLIENT_CONFIG,
+            )
+    return client
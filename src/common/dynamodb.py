@@ -4,13 +4,18 @@ import functools
 import logging
 import os
 import random
+import sys
+import threading
 import time
 from typing import Dict, List, Optional
 
 import boto3
 from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.types import TypeSerializer
 from botocore.exceptions import ClientError
 
+from src.common.clients import CLIENT_CONFIG
+
 logger = logging.getLogger(__name__)
 
 # Retry configuration
@@ -24,6 +29,10 @@ _THROTTLE_CODES = frozenset({
     "RequestLimitExceeded",
 })
 
+_CONDITION_FAILED = "ConditionalCheckFailedException"
+
+_serializer = TypeSerializer()
+
 
 def retry_on_throttle(func):
     """Retry DynamoDB operations on throttling with exponential backoff + jitter."""
@@ -51,12 +60,66 @@ def retry_on_throttle(func):
     return wrapper
 
 
+# Default resource + Table objects, cached per thread (boto3 resources
+# are not thread-safe, and dispatch writes from a thread pool).
+_local = threading.local()
+_resource_lock = threading.Lock()
+_client = None
+
+
+def _get_resource():
+    """Return this thread's cached DynamoDB service resource."""
+    resource = getattr(_local, "resource", None)
+    if resource is None:
+        # boto3's default session isn't safe for concurrent creation
+        with _resource_lock:
+            resource = boto3.resource("dynamodb", config=CLIENT_CONFIG)
+        _local.resource = resource
+        _local.tables = {}
+    return resource
+
+
+def _get_client():
+    """Return the shared low-level DynamoDB client (clients are thread-safe)."""
+    global _client
+    if _client is None:
+        with _resource_lock:
+            if _client is None:
+                _client = boto3.client("dynamodb", config=CLIENT_CONFIG)
+    return _client
+
+
 def _get_table(table_env_var: str, dynamodb_resource=None):
-    """Get a DynamoDB table resource."""
-    if dynamodb_resource is None:
-        dynamodb_resource = boto3.resource("dynamodb")
+    """Get a DynamoDB table resource.
+
+    Without an explicit dynamodb_resource, the Table is cached per
+    thread by table name.
+    """
     table_name = os.environ[table_env_var]
-    return dynamodb_resource.Table(table_name)
+    if dynamodb_resource is not None:
+        return dynamodb_resource.Table(table_name)
+    resource = _get_resource()
+    table = _local.tables.get(table_name)
+    if table is None:
+        table = _local.tables[table_name] = resource.Table(table_name)
+    return table
+
+
+def _paginate(table, method: str, **kwargs) -> List[dict]:
+    """Call table.<method> (query/scan), following LastEvaluatedKey.
+
+    DynamoDB stops each response at 1MB; this keeps reading until every
+    matching item has been returned.
+    """
+    operation = getattr(table, method)
+    items: List[dict] = []
+    while True:
+        response = operation(**kwargs)
+        items.extend(response.get("Items", []))
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return items
+        kwargs["ExclusiveStartKey"] = last_key
 
 
 # --- Orders table operations ---
@@ -80,6 +143,27 @@ def put_order(
     table.put_item(Item=item)
 
 
+@retry_on_throttle
+def put_orders_bulk(
+    run_id: str,
+    orders: Dict[str, dict],
+    dynamodb_resource=None,
+) -> None:
+    """Insert many orders ({order_num: order_data}) via BatchWriteItem.
+
+    batch_writer groups puts 25 per request and resends unprocessed items.
+    """
+    table = _get_table("AWS_EXE_SYS_ORDERS_TABLE", dynamodb_resource)
+    with table.batch_writer(overwrite_by_pkeys=["pk"]) as batch:
+        for order_num, order_data in orders.items():
+            batch.put_item(Item={
+                "pk": f"{run_id}:{order_num}",
+                "run_id": run_id,
+                "order_num": order_num,
+                **order_data,
+            })
+
+
 @retry_on_throttle
 def get_order(
     run_id: str,
@@ -97,13 +181,22 @@ def get_all_orders(
     run_id: str,
     dynamodb_resource=None,
 ) -> List[dict]:
-    """Query all orders for a run_id using GSI."""
+    """Query all orders for a run_id using GSI.
+
+    Statuses are interned so the orchestrator's comparisons against the
+    status constants mostly resolve on identity.
+    """
     table = _get_table("AWS_EXE_SYS_ORDERS_TABLE", dynamodb_resource)
-    response = table.query(
+    orders = _paginate(
+        table, "query",
         IndexName="run_id-order_num-index",
         KeyConditionExpression=Key("run_id").eq(run_id),
     )
-    return response.get("Items", [])
+    for order in orders:
+        status = order.get("status")
+        if isinstance(status, str):
+            order["status"] = sys.intern(status)
+    return orders
 
 
 @retry_on_throttle
@@ -115,29 +208,94 @@ def update_order_status(
     dynamodb_resource=None,
 ) -> None:
     """Update order status and last_update timestamp."""
-    table = _get_table("AWS_EXE_SYS_ORDERS_TABLE", dynamodb_resource)
-    update_expr = "SET #status = :status, last_update = :last_update"
-    expr_values = {
-        ":status": status,
-        ":last_update": int(time.time()),
+    updates = {"status": status, "last_update": int(time.time())}
+    if extra_fields:
+        updates.update(extra_fields)
+    key = {"pk": f"{run_id}:{order_num}"}
+
+    if dynamodb_resource is not None:
+        table = _get_table("AWS_EXE_SYS_ORDERS_TABLE", dynamodb_resource)
+        table.update_item(Key=key, **_set_expression(updates))
+    else:
+        _client_update_item(os.environ["AWS_EXE_SYS_ORDERS_TABLE"], key, updates)
+
+
+def _set_expression(updates: dict, serialize=None) -> dict:
+    """Build UpdateExpression/names/values that SET every key in updates."""
+    sets = []
+    expr_names = {}
+    expr_values = {}
+    for k, v in updates.items():
+        safe_key = k.replace("-", "_")
+        sets.append(f"#{safe_key} = :{safe_key}")
+        expr_names[f"#{safe_key}"] = k
+        expr_values[f":{safe_key}"] = serialize(v) if serialize else v
+    return {
+        "UpdateExpression": "SET " + ", ".join(sets),
+        "ExpressionAttributeNames": expr_names,
+        "ExpressionAttributeValues": expr_values,
     }
-    expr_names = {"#status": "status"}
 
-    if extra_fields:
-        for k, v in extra_fields.items():
-            safe_key = k.replace("-", "_")
-            update_expr += f", #{safe_key} = :{safe_key}"
-            expr_values[f":{safe_key}"] = v
-            expr_names[f"#{safe_key}"] = k
 
-    table.update_item(
-        Key={"pk": f"{run_id}:{order_num}"},
-        UpdateExpression=update_expr,
-        ExpressionAttributeValues=expr_values,
-        ExpressionAttributeNames=expr_names,
+def _client_update_item(table_name: str, key: dict, updates: dict) -> None:
+    """update_item through the low-level client.
+
+    Values are serialized once with TypeSerializer, skipping the resource
+    layer's per-call model walk and attribute transformation.
+    """
+    serialize = _serializer.serialize
+    _get_client().update_item(
+        TableName=table_name,
+        Key={k: serialize(v) for k, v in key.items()},
+        **_set_expression(updates, serialize),
     )
 
 
+@retry_on_throttle
+def transact_order_completion(
+    run_id: str,
+    order_num: str,
+    status: str,
+    trace_id: str,
+    order_name: str,
+    event_type: str,
+    extra_fields: Optional[dict] = None,
+    event_fields: Optional[dict] = None,
+    dynamodb_resource=None,
+) -> None:
+    """Update an order's status and write its event in one transaction.
+
+    One TransactWriteItems round trip instead of an UpdateItem plus a
+    PutItem, and the order never ends up updated without its event.
+    """
+    updates = {"status": status, "last_update": int(time.time())}
+    if extra_fields:
+        updates.update(extra_fields)
+    event = _event_item(
+        trace_id, order_name, event_type, status, extra_fields=event_fields,
+    )
+    if dynamodb_resource is not None:
+        # A resource's client serializes attribute values itself
+        client = dynamodb_resource.meta.client
+
+        def serialize(value):
+            return value
+    else:
+        client = _get_client()
+        serialize = _serializer.serialize
+    client.transact_write_items(TransactItems=[
+        {"Update": {
+            "TableName": os.environ["AWS_EXE_SYS_ORDERS_TABLE"],
+            "Key": {"pk": serialize(f"{run_id}:{order_num}")},
+            **_set_expression(updates, serialize),
+        }},
+        {"Put": {
+            "TableName": os.environ["AWS_EXE_SYS_ORDER_EVENTS_TABLE"],
+            "Item": {k: serialize(v) for k, v in event.items()},
+        }},
+    ])
+
+
 # --- Order events table operations ---
 
 
@@ -158,11 +316,40 @@ def put_event(
         extra_fields: Metadata fields (flow_id, run_id) -- stored at top level.
     """
     table = _get_table("AWS_EXE_SYS_ORDER_EVENTS_TABLE", dynamodb_resource)
+    table.put_item(Item=_event_item(
+        trace_id, order_name, event_type, status, data, extra_fields,
+    ))
+
+
+@retry_on_throttle
+def put_events_bulk(
+    events: List[dict],
+    dynamodb_resource=None,
+) -> None:
+    """Insert many events via BatchWriteItem.
+
+    Each entry takes the same keyword arguments as put_event (without
+    dynamodb_resource).
+    """
+    table = _get_table("AWS_EXE_SYS_ORDER_EVENTS_TABLE", dynamodb_resource)
+    with table.batch_writer(overwrite_by_pkeys=["trace_id", "sk"]) as batch:
+        for event in events:
+            batch.put_item(Item=_event_item(**event))
+
+
+def _event_item(
+    trace_id: str,
+    order_name: str,
+    event_type: str,
+    status: str,
+    data: Optional[dict] = None,
+    extra_fields: Optional[dict] = None,
+) -> dict:
+    """Build an events table item with current epoch as SK."""
     epoch = str(int(time.time()))
-    sk = f"{order_name}:{epoch}"
     item = {
         "trace_id": trace_id,
-        "sk": sk,
+        "sk": f"{order_name}:{epoch}",
         "order_name": order_name,
         "epoch": epoch,
         "event_type": event_type,
@@ -172,7 +359,7 @@ def put_event(
         item.update(extra_fields)
     if data:
         item["data"] = data
-    table.put_item(Item=item)
+    return item
 
 
 @retry_on_throttle
@@ -184,15 +371,13 @@ def get_events(
     """Query events for a trace_id, optional begins_with filter on SK."""
     table = _get_table("AWS_EXE_SYS_ORDER_EVENTS_TABLE", dynamodb_resource)
     if order_name_prefix:
-        response = table.query(
-            KeyConditionExpression=Key("trace_id").eq(trace_id)
+        key_condition = (
+            Key("trace_id").eq(trace_id)
             & Key("sk").begins_with(f"{order_name_prefix}:")
         )
     else:
-        response = table.query(
-            KeyConditionExpression=Key("trace_id").eq(trace_id)
-        )
-    return response.get("Items", [])
+        key_condition = Key("trace_id").eq(trace_id)
+    return _paginate(table, "query", KeyConditionExpression=key_condition)
 
 
 @retry_on_throttle
@@ -247,7 +432,11 @@ def acquire_lock(
             ConditionExpression=Attr("pk").not_exists() | Attr("status").eq("completed"),
         )
         return True
-    except table.meta.client.exceptions.ConditionalCheckFailedException:
+    except ClientError as exc:
+        # Matched by code: the modeled exception class hangs off each
+        # client instance, so there's no module-level class to bind
+        if exc.response["Error"]["Code"] != _CONDITION_FAILED:
+            raise
         return False
 
 
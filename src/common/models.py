@@ -1,27 +1,49 @@
 """Data models for aws-execution-engine."""
 
-import base64
 import json
+import sys
 import time
 import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-# Status constants
-QUEUED = "queued"
-RUNNING = "running"
-SUCCEEDED = "succeeded"
-FAILED = "failed"
-TIMED_OUT = "timed_out"
+try:
+    # SIMD base64 (same API as the stdlib module); optional
+    import pybase64 as base64
+except ImportError:  # pragma: no cover
+    import base64
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Status constants (interned so statuses read back from DynamoDB can be
+# interned to the same objects)
+QUEUED = sys.intern("queued")
+RUNNING = sys.intern("running")
+SUCCEEDED = sys.intern("succeeded")
+FAILED = sys.intern("failed")
+TIMED_OUT = sys.intern("timed_out")
 
 # Reserved order name for job-level events
-JOB_ORDER_NAME = "_job"
+JOB_ORDER_NAME = sys.intern("_job")
 
 # Valid execution targets
 EXECUTION_TARGETS = frozenset({"lambda", "codebuild", "ssm"})
 
 
-@dataclass
+def _to_dict(record) -> dict:
+    """Non-None dataclass fields of record, read directly (no asdict deepcopy)."""
+    return {k: v for k in record._FIELDS if (v := getattr(record, k)) is not None}
+
+
+def _known_fields(cls, data: dict) -> dict:
+    """Entries of data that name a field of cls."""
+    return {k: data[k] for k in cls._FIELDS if k in data}
+
+
+@dataclass(slots=True)
 class Order:
     """Per-order fields from job parameters."""
 
@@ -44,16 +66,14 @@ class Order:
     ssm_targets: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return _to_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Order":
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered)
+        return cls(**_known_fields(cls, data))
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Global job-level fields plus list of orders."""
 
@@ -71,28 +91,34 @@ class Job:
     job_timeout: int = 3600
 
     def to_dict(self) -> dict:
-        d = asdict(self)
+        d = _to_dict(self)
         d["orders"] = [o.to_dict() for o in self.orders]
-        return {k: v for k, v in d.items() if v is not None}
+        return d
 
     @classmethod
     def from_dict(cls, data: dict) -> "Job":
         orders_data = data.get("orders", [])
         orders = [Order.from_dict(o) for o in orders_data]
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields and k != "orders"}
+        filtered = _known_fields(cls, data)
+        filtered.pop("orders", None)
         return cls(orders=orders, **filtered)
 
     def to_b64(self) -> str:
-        return base64.b64encode(json.dumps(self.to_dict()).encode()).decode()
+        if orjson is not None:
+            # orjson emits bytes directly -- no str round trip before base64
+            payload = orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(self.to_dict()).encode()
+        return base64.b64encode(payload).decode()
 
     @classmethod
     def from_b64(cls, b64_str: str) -> "Job":
-        data = json.loads(base64.b64decode(b64_str).decode())
+        raw = base64.b64decode(b64_str)
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return cls.from_dict(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderEvent:
     """Event record for the order_events DynamoDB table."""
 
@@ -108,16 +134,14 @@ class OrderEvent:
     run_id: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return _to_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "OrderEvent":
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered)
+        return cls(**_known_fields(cls, data))
 
 
-@dataclass
+@dataclass(slots=True)
 class LockRecord:
     """Lock record for the orchestrator_locks DynamoDB table."""
 
@@ -130,16 +154,14 @@ class LockRecord:
     trace_id: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return _to_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "LockRecord":
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered)
+        return cls(**_known_fields(cls, data))
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRecord:
     """DynamoDB record representation for the orders table.
 
@@ -176,12 +198,19 @@ class OrderRecord:
         return f"{self.run_id}:{self.order_num}"
 
     def to_dict(self) -> dict:
-        d = asdict(self)
+        d = _to_dict(self)
         d["pk"] = self.pk
-        return {k: v for k, v in d.items() if v is not None}
+        return d
 
     @classmethod
     def from_dict(cls, data: dict) -> "OrderRecord":
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered)
+        fields = _known_fields(cls, data)
+        if isinstance(fields.get("status"), str):
+            fields["status"] = sys.intern(fields["status"])
+        return cls(**fields)
+
+
+# Field names per record type, computed once at import rather than per call
+for _cls in (Order, Job, OrderEvent, LockRecord, OrderRecord):
+    _cls._FIELDS = tuple(_cls.__dataclass_fields__)
+del _cls
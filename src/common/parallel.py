@@ -0,0 +1,48 @@
+"""Thread-pool fan-out for per-order work, sized to the Lambda's memory."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional
+
+# Upper bound on orders processed at once; each is bound by AWS round trips
+ORDER_MAX_WORKERS = 16
+
+# Peak memory one order can hold while it is repackaged: an in-memory S3
+# spool (code_source.SPOOL_MAX_SIZE, 32 MB) or zip payloads waiting to be
+# written (code_source.ZIP_MAX_IN_FLIGHT_BYTES of source plus their
+# compressed copies), with headroom
+ORDER_MEMORY_MB = 64
+
+
+def order_workers() -> int:
+    """Worker count that fits the function's memory, capped at ORDER_MAX_WORKERS.
+
+    Uses AWS_LAMBDA_FUNCTION_MEMORY_SIZE; half of it is left for the
+    runtime. Outside Lambda the cap applies.
+    """
+    try:
+        memory_mb = int(os.environ["AWS_LAMBDA_FUNCTION_MEMORY_SIZE"])
+    except (KeyError, ValueError):
+        return ORDER_MAX_WORKERS
+    return max(1, min(ORDER_MAX_WORKERS, memory_mb // 2 // ORDER_MEMORY_MB))
+
+
+def run_parallel(
+    fn: Callable, tasks: List[tuple], max_workers: Optional[int] = None,
+) -> None:
+    """Run fn(*task) for every task on a thread pool; re-raise the first error.
+
+    max_workers defaults to order_workers().
+    """
+    if not tasks:
+        return
+    workers = min(max_workers or order_workers(), len(tasks))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(fn, *task) for task in tasks]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
@@ -2,15 +2,31 @@
 
 import json
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Set
 
-import boto3
+from boto3.s3.transfer import TransferConfig
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from src.common.clients import get_client
+
+# exec.zip uploads: parts of 16MB sent 8 at a time once past 8MB
+EXEC_UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
 
 
 def _get_client(s3_client=None):
-    """Get an S3 client."""
+    """Get an S3 client (the shared cached one unless s3_client is given)."""
     if s3_client is None:
-        s3_client = boto3.client("s3")
+        s3_client = get_client("s3")
     return s3_client
 
 
@@ -24,7 +40,7 @@ def upload_exec_zip(
     """Upload exec.zip to tmp/exec/<run_id>/<order_num>/exec.zip."""
     client = _get_client(s3_client)
     key = f"tmp/exec/{run_id}/{order_num}/exec.zip"
-    client.upload_file(file_path, bucket, key)
+    client.upload_file(file_path, bucket, key, Config=EXEC_UPLOAD_CONFIG)
     return key
 
 
@@ -46,6 +62,21 @@ def generate_callback_presigned_url(
     return url
 
 
+def _put_json(client, bucket: str, key: str, payload: dict) -> None:
+    """Serialize payload straight to bytes and PUT it as a JSON object."""
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(payload).encode()
+    client.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=body,
+        ContentType="application/json",
+        CacheControl="no-cache",
+    )
+
+
 def read_result(
     bucket: str,
     run_id: str,
@@ -57,12 +88,38 @@ def read_result(
     key = f"tmp/callbacks/runs/{run_id}/{order_num}/result.json"
     try:
         response = client.get_object(Bucket=bucket, Key=key)
-        body = response["Body"].read().decode("utf-8")
-        return json.loads(body)
+        body = response["Body"].read()
+        return orjson.loads(body) if orjson is not None else json.loads(body)
     except client.exceptions.NoSuchKey:
         return None
 
 
+# Result objects are tiny; reads are round-trip bound, so fan out wide
+RESULT_READ_WORKERS = 32
+
+
+def read_results_batch(
+    bucket: str,
+    run_id: str,
+    order_nums: Iterable[str],
+    s3_client=None,
+) -> Dict[str, dict]:
+    """Read result.json for many orders concurrently.
+
+    Returns {order_num: result} for the orders that have a result.
+    """
+    order_nums = list(order_nums)
+    if not order_nums:
+        return {}
+    client = _get_client(s3_client)
+    with ThreadPoolExecutor(max_workers=min(RESULT_READ_WORKERS, len(order_nums))) as pool:
+        results = pool.map(
+            lambda num: read_result(bucket, run_id, num, s3_client=client),
+            order_nums,
+        )
+        return {num: r for num, r in zip(order_nums, results) if r is not None}
+
+
 def write_result(
     bucket: str,
     run_id: str,
@@ -74,8 +131,7 @@ def write_result(
     """Write result.json directly to S3 (used by watchdog, not workers)."""
     client = _get_client(s3_client)
     key = f"tmp/callbacks/runs/{run_id}/{order_num}/result.json"
-    payload = json.dumps({"status": status, "log": log})
-    client.put_object(Bucket=bucket, Key=key, Body=payload)
+    _put_json(client, bucket, key, {"status": status, "log": log})
     return key
 
 
@@ -87,8 +143,7 @@ def write_init_trigger(
     """Write the init trigger result.json for order 0000."""
     client = _get_client(s3_client)
     key = f"tmp/callbacks/runs/{run_id}/0000/result.json"
-    payload = json.dumps({"status": "init", "log": ""})
-    client.put_object(Bucket=bucket, Key=key, Body=payload)
+    _put_json(client, bucket, key, {"status": "init", "log": ""})
     return key
 
 
@@ -102,8 +157,7 @@ def write_done_endpoint(
     """Write <run_id>/done to the done bucket."""
     client = _get_client(s3_client)
     key = f"{run_id}/done"
-    payload = json.dumps({"status": status, "summary": summary})
-    client.put_object(Bucket=bucket, Key=key, Body=payload)
+    _put_json(client, bucket, key, {"status": status, "summary": summary})
     return key
 
 
@@ -121,3 +175,35 @@ def check_result_exists(
         return True
     except client.exceptions.ClientError:
         return False
+
+
+def list_completed_orders(
+    bucket: str,
+    run_id: str,
+    s3_client=None,
+) -> Set[str]:
+    """Return the order_nums that have a result.json for run_id.
+
+    One paginated LIST under the run's callback prefix (1000 keys per
+    page) replaces a HEAD per order.
+    """
+    client = _get_client(s3_client)
+    prefix = f"tmp/callbacks/runs/{run_id}/"
+    completed = set()
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            order_num, _, name = obj["Key"][len(prefix):].partition("/")
+            if name == "result.json":
+                completed.add(order_num)
+    return completed
+
+
+def check_results_exist_batch(
+    bucket: str,
+    run_id: str,
+    order_nums: Iterable[str],
+    s3_client=None,
+) -> Set[str]:
+    """Return the subset of order_nums that have a result.json."""
+    return list_completed_orders(bucket, run_id, s3_client=s3_client).intersection(order_nums)
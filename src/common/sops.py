@@ -7,13 +7,28 @@ import tempfile
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, Tuple
 
-import boto3
+try:
+    # In-process age key generation (Rust bindings); optional
+    from pyrage import x25519 as age_x25519
+except ImportError:  # pragma: no cover
+    age_x25519 = None
 
+from src.common.clients import get_client
+from src.common.code_source import detach_file
 
-def _run_cmd(cmd: list, env: Optional[dict] = None) -> str:
-    """Run a subprocess command and return stdout."""
+
+def _run_cmd(
+    cmd: list,
+    env: Optional[dict] = None,
+    input: Optional[str] = None,
+) -> str:
+    """Run a subprocess command and return stdout.
+
+    ``input`` is written to the command's stdin when given.
+    """
     result = subprocess.run(
         cmd,
+        input=input,
         capture_output=True,
         text=True,
         env={**os.environ, **(env or {})},
@@ -23,15 +38,23 @@ def _run_cmd(cmd: list, env: Optional[dict] = None) -> str:
     return result.stdout
 
 
-def _generate_age_key() -> Tuple[str, str, str]:
+def _generate_age_key() -> Tuple[str, str]:
     """Generate a temporary age key pair.
 
-    Returns (public_key, private_key_content, secret_key_file_path).
+    Returns (public_key, private_key_content). The private key is only
+    held in memory; nothing is written to disk. Uses pyrage when
+    installed, which avoids forking age-keygen; the content has the same
+    layout age-keygen writes.
     """
-    key_file = tempfile.mktemp(suffix=".key")
-    _run_cmd(["age-keygen", "-o", key_file])
-    with open(key_file, "r") as f:
-        content = f.read()
+    if age_x25519 is not None:
+        identity = age_x25519.Identity.generate()
+        public_key = str(identity.to_public())
+        created = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        content = f"# created: {created}\n# public key: {public_key}\n{identity}\n"
+        return public_key, content
+
+    # Without -o, age-keygen writes the key to stdout
+    content = _run_cmd(["age-keygen"])
     public_key = None
     for line in content.splitlines():
         if line.startswith("# public key:"):
@@ -39,7 +62,7 @@ def _generate_age_key() -> Tuple[str, str, str]:
             break
     if not public_key:
         raise RuntimeError("Failed to extract public key from age-keygen output")
-    return public_key, content, key_file
+    return public_key, content
 
 
 def store_sops_key_ssm(
@@ -53,7 +76,7 @@ def store_sops_key_ssm(
     Uses advanced tier to support parameter policies (expiration).
     Returns the SSM parameter path.
     """
-    ssm = boto3.client("ssm")
+    ssm = get_client("ssm")
     path = f"/aws-exe-sys/sops-keys/{run_id}/{order_num}"
 
     expiration = (
@@ -84,14 +107,14 @@ def fetch_sops_key_ssm(ssm_path: str) -> str:
 
     Returns the private key string.
     """
-    ssm = boto3.client("ssm")
+    ssm = get_client("ssm")
     resp = ssm.get_parameter(Name=ssm_path, WithDecryption=True)
     return resp["Parameter"]["Value"]
 
 
 def delete_sops_key_ssm(ssm_path: str) -> None:
     """Delete SOPS age private key from SSM (cleanup after job completion)."""
-    ssm = boto3.client("ssm")
+    ssm = get_client("ssm")
     try:
         ssm.delete_parameter(Name=ssm_path)
     except ssm.exceptions.ParameterNotFound:
@@ -107,20 +130,14 @@ def encrypt_env(
     If no sops_key provided, generates a temporary age key.
     Returns (path_to_encrypted_file, key_used).
     """
-    # Write plaintext env vars as JSON
-    plaintext_file = tempfile.mktemp(suffix=".json")
-    with open(plaintext_file, "w") as f:
-        json.dump(env_vars, f)
-
     encrypted_file = tempfile.mktemp(suffix=".enc.json")
 
     if sops_key is None:
-        public_key, _private_key_content, key_file = _generate_age_key()
-        sops_key = public_key
-        env_extra = {"SOPS_AGE_KEY_FILE": key_file}
-    else:
-        env_extra = {}
+        # Encrypting only needs the public recipient; the private half is
+        # never handed to the sops process
+        sops_key, _private_key_content = _generate_age_key()
 
+    # Plaintext goes in on stdin so it never touches disk
     _run_cmd(
         [
             "sops",
@@ -129,14 +146,11 @@ def encrypt_env(
             "--input-type", "json",
             "--output-type", "json",
             "--output", encrypted_file,
-            plaintext_file,
+            "/dev/stdin",
         ],
-        env=env_extra,
+        input=json.dumps(env_vars),
     )
 
-    # Clean up plaintext
-    os.unlink(plaintext_file)
-
     return encrypted_file, sops_key
 
 
@@ -189,6 +203,7 @@ def repackage_order(
 
     # Write env_vars.env — plaintext var names only (no values)
     env_file = os.path.join(code_dir, "env_vars.env")
+    detach_file(env_file)
     with open(env_file, "w") as f:
         for key in sorted(merged.keys()):
             f.write(f"{key}\n")
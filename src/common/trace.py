@@ -1,12 +1,12 @@
 """Trace ID generation and parsing."""
 
-import secrets
+import os
 import time
 
 
 def generate_trace_id() -> str:
     """Generate a random hex trace ID (8 chars)."""
-    return secrets.token_hex(4)
+    return os.urandom(4).hex()
 
 
 def create_leg(trace_id: str) -> str:
@@ -16,5 +16,7 @@ def create_leg(trace_id: str) -> str:
 
 def parse_leg(leg_str: str) -> tuple:
     """Parse a leg string into (trace_id, epoch_time) tuple."""
-    parts = leg_str.split(":", 1)
-    return parts[0], int(parts[1])
+    sep = leg_str.rfind(":")
+    if sep < 0:
+        raise ValueError(f"Invalid leg string: {leg_str!r}")
+    return leg_str[:sep], int(leg_str[sep + 1:])
@@ -39,11 +39,12 @@ class VcsProvider(ABC):
 
     @abstractmethod
     def get_comments(
-        self, repo: str, pr_number: int, token: str,
+        self, repo: str, pr_number: int, token: str, use_cache: bool = True,
     ) -> List[dict]:
         """Return all comments for a PR.
 
         Each dict must contain at least 'id' and 'body' keys.
-        Providers handle pagination internally.
+        Providers handle pagination internally. Providers that cache
+        listings must skip the cache when use_cache is False.
         """
         ...
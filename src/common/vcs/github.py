@@ -1,84 +1,331 @@
 """GitHub VCS provider implementation."""
 
-from typing import List, Optional
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from .base import VcsProvider
 
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_PER_PAGE = 100
+GITHUB_PAGE_WORKERS = 8
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
+
+# Seconds a fetched comment listing is reused before GitHub is asked again
+COMMENT_CACHE_TTL = 30
+# Most PR listings kept per provider; the least recently used is dropped
+COMMENT_CACHE_MAX_ENTRIES = 64
+# Most comment pages whose ETag and body are kept for conditional GETs
+PAGE_ETAG_MAX_ENTRIES = 256
+
+# Only the database id and body of each comment, 100 per page
+_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issueOrPullRequest(number: $number) {
+      ... on Issue { comments(first: 100, after: $cursor) { ...page } }
+      ... on PullRequest { comments(first: 100, after: $cursor) { ...page } }
+    }
+  }
+}
+fragment page on IssueCommentConnection {
+  nodes { databaseId body }
+  pageInfo { hasNextPage endCursor }
+}
+"""
+
+# Retry rate limiting and transient server errors; urllib3 only retries idempotent methods
+GITHUB_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False,
+)
+
+
+def _encode(payload: dict) -> bytes:
+    """Serialize a request body to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _decode(response: requests.Response):
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _token_key(token: str) -> str:
+    """Short digest of a token, so cache keys never hold the token itself."""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
 
 
 class GitHubProvider(VcsProvider):
     """GitHub implementation of the VCS provider.
 
     Handles GitHub-specific HTTP calls, authentication, and pagination.
+    Requests share one Session so connections are kept alive between calls.
     """
 
+    def __init__(self):
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=GITHUB_RETRY),
+        )
+        self._session.headers.update({"Accept": "application/vnd.github+json"})
+        # Both caches are keyed by a token digest first: the provider is shared
+        # across warm invocations that may use different installations.
+        # (token, repo, pr_number) -> (monotonic fetch time, comments)
+        self._comment_cache: Dict[Tuple[str, str, int], Tuple[float, List[dict]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # (token, url, page) -> (ETag, comments, Link header) for conditional GETs
+        self._page_etags: Dict[Tuple[str, str, int], Tuple[str, List[dict], dict]] = OrderedDict()
+
     def _auth_headers(self, token: str) -> dict:
-        return {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json",
-        }
+        return {"Authorization": f"Bearer {token}"}
+
+    def _json_headers(self, token: str) -> dict:
+        return {**self._auth_headers(token), "Content-Type": "application/json"}
+
+    def _get_page(self, url: str, page: int, token: str) -> Tuple[List[dict], dict]:
+        """Fetch one comment page, returning (comments, parsed Link header).
+
+        Pages seen before are revalidated with If-None-Match; a 304 reuses
+        the stored page without a body or a JSON parse.
+        """
+        key = (_token_key(token), url, page)
+        headers = self._auth_headers(token)
+        with self._cache_lock:
+            seen = self._page_etags.get(key)
+            if seen is not None:
+                self._page_etags.move_to_end(key)
+        if seen is not None:
+            headers["If-None-Match"] = seen[0]
+        response = self._session.get(
+            url,
+            params={"page": page, "per_page": GITHUB_PER_PAGE},
+            headers=headers,
+        )
+        if response.status_code == 304 and seen is not None:
+            return seen[1], seen[2]
+        response.raise_for_status()
+        comments, links = _decode(response), response.links
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._cache_lock:
+                self._page_etags[key] = (etag, comments, links)
+                self._page_etags.move_to_end(key)
+                while len(self._page_etags) > PAGE_ETAG_MAX_ENTRIES:
+                    self._page_etags.popitem(last=False)
+        return comments, links
+
+    @staticmethod
+    def _last_page(links: dict) -> int:
+        """Page number from the Link rel="last" header, or 0 if absent."""
+        last = links.get("last")
+        if not last:
+            return 0
+        pages = parse_qs(urlparse(last["url"]).query).get("page")
+        return int(pages[0]) if pages else 0
+
+    def _cached_comments(
+        self, repo: str, pr_number: int, token: str,
+    ) -> Optional[List[dict]]:
+        """Comments fetched with token within COMMENT_CACHE_TTL, or None.
+
+        An expired entry is dropped when it is looked up.
+        """
+        key = (_token_key(token), repo, pr_number)
+        with self._cache_lock:
+            entry = self._comment_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > COMMENT_CACHE_TTL:
+                del self._comment_cache[key]
+                return None
+            self._comment_cache.move_to_end(key)
+            return list(entry[1])
+
+    def _store_comments(
+        self, repo: str, pr_number: int, token: str, comments: List[dict],
+    ) -> None:
+        """Cache a listing, pruning expired entries and capping the cache size."""
+        key = (_token_key(token), repo, pr_number)
+        now = time.monotonic()
+        with self._cache_lock:
+            expired = [
+                stale for stale, (fetched, _) in self._comment_cache.items()
+                if now - fetched > COMMENT_CACHE_TTL
+            ]
+            for stale in expired:
+                del self._comment_cache[stale]
+            self._comment_cache[key] = (now, comments)
+            self._comment_cache.move_to_end(key)
+            while len(self._comment_cache) > COMMENT_CACHE_MAX_ENTRIES:
+                self._comment_cache.popitem(last=False)
+
+    def _invalidate_comments(self, repo: str, pr_number: Optional[int] = None) -> None:
+        """Drop cached listings and page ETags for one PR, or for every PR of repo.
+
+        Entries are dropped for every token, since the comments changed.
+        """
+        if pr_number is None:
+            prefix = f"{GITHUB_API_BASE}/repos/{repo}/issues/"
+        else:
+            prefix = f"{GITHUB_API_BASE}/repos/{repo}/issues/{pr_number}/comments"
+        with self._cache_lock:
+            for key in list(self._comment_cache):
+                if key[1] == repo and pr_number in (None, key[2]):
+                    del self._comment_cache[key]
+            for key in list(self._page_etags):
+                if key[1].startswith(prefix):
+                    del self._page_etags[key]
 
     def get_comments(
+        self, repo: str, pr_number: int, token: str, use_cache: bool = True,
+    ) -> List[dict]:
+        """Return all comments for a PR, handling GitHub pagination.
+
+        Listings are cached for COMMENT_CACHE_TTL seconds and dropped when
+        this provider creates, updates or deletes a comment on the repo.
+        With use_cache=False GitHub is always asked, since comments posted
+        from other containers never invalidate this cache.
+        """
+        if use_cache:
+            cached = self._cached_comments(repo, pr_number, token)
+            if cached is not None:
+                return cached
+        comments = self._fetch_comments(repo, pr_number, token)
+        self._store_comments(repo, pr_number, token, comments)
+        return list(comments)
+
+    def _fetch_comments(
         self, repo: str, pr_number: int, token: str,
     ) -> List[dict]:
-        """Return all comments for a PR, handling GitHub pagination."""
+        """Fetch every comment page from the REST API.
+
+        When page 1 carries a Link rel="last" header, the remaining pages
+        are fetched concurrently; otherwise pages are walked one by one.
+        """
         url = f"{GITHUB_API_BASE}/repos/{repo}/issues/{pr_number}/comments"
-        all_comments = []
+        first, links = self._get_page(url, 1, token)
+        all_comments = list(first)
+
+        last_page = self._last_page(links)
+        if last_page > 1:
+            workers = min(GITHUB_PAGE_WORKERS, last_page - 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                pages = pool.map(
+                    lambda page: self._get_page(url, page, token)[0],
+                    range(2, last_page + 1),
+                )
+                for comments in pages:
+                    all_comments.extend(comments)
+            return all_comments
+
+        comments = all_comments
         page = 1
-        while True:
-            response = requests.get(
-                url,
-                params={"page": page, "per_page": 100},
-                headers=self._auth_headers(token),
-            )
-            response.raise_for_status()
-            comments = response.json()
-            if not comments:
-                break
-            all_comments.extend(comments)
-            if len(comments) < 100:
-                break
+        while len(comments) >= GITHUB_PER_PAGE:
             page += 1
+            comments, _ = self._get_page(url, page, token)
+            all_comments.extend(comments)
         return all_comments
 
     def create_comment(self, repo: str, pr_number: int, body: str, token: str) -> int:
         """POST to GitHub REST API to create a PR comment."""
         url = f"{GITHUB_API_BASE}/repos/{repo}/issues/{pr_number}/comments"
-        response = requests.post(
+        response = self._session.post(
             url,
-            json={"body": body},
-            headers=self._auth_headers(token),
+            data=_encode({"body": body}),
+            headers=self._json_headers(token),
         )
         response.raise_for_status()
-        return response.json()["id"]
+        self._invalidate_comments(repo, pr_number)
+        return _decode(response)["id"]
 
     def update_comment(self, repo: str, comment_id: int, body: str, token: str) -> bool:
         """PATCH to update an existing comment."""
         url = f"{GITHUB_API_BASE}/repos/{repo}/issues/comments/{comment_id}"
-        response = requests.patch(
+        response = self._session.patch(
             url,
-            json={"body": body},
-            headers=self._auth_headers(token),
+            data=_encode({"body": body}),
+            headers=self._json_headers(token),
         )
+        self._invalidate_comments(repo)
         return response.status_code == 200
 
     def delete_comment(self, repo: str, comment_id: int, token: str) -> bool:
         """DELETE a comment."""
         url = f"{GITHUB_API_BASE}/repos/{repo}/issues/comments/{comment_id}"
-        response = requests.delete(url, headers=self._auth_headers(token))
+        response = self._session.delete(url, headers=self._auth_headers(token))
+        self._invalidate_comments(repo)
         return response.status_code == 204
 
+    def _graphql(self, query: str, variables: dict, token: str) -> dict:
+        """POST a GraphQL query and return its data; raises on errors."""
+        response = self._session.post(
+            GITHUB_GRAPHQL_URL,
+            data=_encode({"query": query, "variables": variables}),
+            headers=self._json_headers(token),
+        )
+        response.raise_for_status()
+        payload = _decode(response)
+        if payload.get("errors"):
+            raise ValueError(f"GraphQL errors: {payload['errors']}")
+        return payload["data"]
+
+    def _graphql_search_comment(
+        self, repo: str, pr_number: int, tag: str, token: str,
+    ) -> Optional[int]:
+        """Scan comments over GraphQL, stopping at the first page with a match.
+
+        Only ids and bodies are transferred. Raises on any API error so the
+        caller can fall back to REST.
+        """
+        owner, name = repo.split("/", 1)
+        variables = {"owner": owner, "name": name, "number": pr_number, "cursor": None}
+        while True:
+            data = self._graphql(_COMMENTS_QUERY, variables, token)
+            connection = data["repository"]["issueOrPullRequest"]["comments"]
+            for node in connection["nodes"]:
+                if tag in (node.get("body") or ""):
+                    return node["databaseId"]
+            if not connection["pageInfo"]["hasNextPage"]:
+                return None
+            variables["cursor"] = connection["pageInfo"]["endCursor"]
+
     def find_comment_by_tag(
         self, repo: str, pr_number: int, tag: str, token: str,
     ) -> Optional[int]:
         """Find a comment containing a tag substring anywhere in the body.
 
         General-purpose whole-body search. Returns first match or None.
+        Never answers from the listing cache, because callers use the result
+        to decide between creating and updating a comment. Tries GraphQL and
+        falls back to REST pagination if it fails.
         """
-        for comment in self.get_comments(repo, pr_number, token):
+        try:
+            return self._graphql_search_comment(repo, pr_number, tag, token)
+        except (requests.RequestException, ValueError, KeyError, TypeError):
+            pass
+        for comment in self.get_comments(repo, pr_number, token, use_cache=False):
             if tag in comment.get("body", ""):
                 return comment["id"]
         return None
@@ -5,7 +5,6 @@ Usage:
     vcs.upsert_comment("org/repo", 42, "run-123", "Deploy OK", ["deploy"], token)
 """
 
-import re
 from typing import Dict, Any, List, Optional
 
 from .base import VcsProvider
@@ -16,6 +15,10 @@ PROVIDERS: Dict[str, type] = {
     "github": GitHubProvider,
 }
 
+# One provider instance per name, kept across warm invocations so its
+# HTTP session (and pooled connections) is reused.
+_provider_instances: Dict[str, VcsProvider] = {}
+
 
 class VcsHelper:
     """Provider-agnostic facade that wraps a VcsProvider.
@@ -37,7 +40,10 @@ class VcsHelper:
             raise ValueError(
                 f"Unknown VCS provider '{provider}'. Supported: {supported}"
             )
-        self._provider: VcsProvider = provider_cls()
+        instance = _provider_instances.get(provider)
+        if instance is None:
+            instance = _provider_instances.setdefault(provider, provider_cls())
+        self._provider: VcsProvider = instance
 
     @property
     def provider(self) -> VcsProvider:
@@ -63,9 +69,9 @@ class VcsHelper:
         return self._provider.find_comment_by_tag(repo, pr_number, tag, token)
 
     def get_comments(
-        self, repo: str, pr_number: int, token: str,
+        self, repo: str, pr_number: int, token: str, use_cache: bool = True,
     ) -> List[dict]:
-        return self._provider.get_comments(repo, pr_number, token)
+        return self._provider.get_comments(repo, pr_number, token, use_cache=use_cache)
 
     # ------------------------------------------------------------------
     # Shared business logic — works across all providers
@@ -73,14 +79,17 @@ class VcsHelper:
 
     def search_comments(
         self, repo: str, pr_number: int, search_str: str, token: str,
-        tags: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None, use_cache: bool = True,
     ) -> List[int]:
         """Find all comments whose last line contains a matching tag block.
 
         Strict last-line search using ###search_str### #tag format.
-        Returns list of matching comment IDs.
+        Returns list of matching comment IDs. Pass use_cache=False when the
+        result decides whether to create a comment.
         """
-        comments = self._provider.get_comments(repo, pr_number, token)
+        comments = self._provider.get_comments(
+            repo, pr_number, token, use_cache=use_cache,
+        )
         return [
             c["id"] for c in comments
             if self.has_tag_block_at_last_line(c.get("body", ""), search_str, tags)
@@ -97,7 +106,11 @@ class VcsHelper:
         """
         full_body = f"{comment_body}\n\n{self.format_tags(search_str, tags)}"
 
-        existing_ids = self.search_comments(repo, pr_number, search_str, token, tags)
+        # Always ask the provider: a stale listing would miss comments posted
+        # by other containers and create a duplicate
+        existing_ids = self.search_comments(
+            repo, pr_number, search_str, token, tags, use_cache=False,
+        )
 
         if existing_ids:
             comment_id = existing_ids[0]
@@ -132,24 +145,19 @@ class VcsHelper:
         Matches: ###search_str### optionally followed by #tag1 #tag2 ...
         If tags are provided, all must be present.
         """
-        lines = comment_body.strip().split("\n")
-        last_line = None
-        for line in reversed(lines):
-            stripped = line.strip()
-            if stripped:
-                last_line = stripped
-                break
-
+        # rstrip drops trailing blank lines, so the last line is non-empty
+        body = comment_body.rstrip()
+        last_line = body[body.rfind("\n") + 1:].strip()
         if not last_line:
             return False
 
-        pattern = rf"^###{re.escape(search_str)}###\s*(.*)$"
-        match = re.match(pattern, last_line)
-        if not match:
+        # Plain prefix test; everything after the marker is the tag list
+        prefix = f"###{search_str}###"
+        if not last_line.startswith(prefix):
             return False
 
         if tags:
-            tags_str = match.group(1).strip()
+            tags_str = last_line[len(prefix):].strip()
             existing = {
                 t.lstrip("#") for t in tags_str.split() if t.startswith("#")
             }
@@ -11,8 +11,15 @@ import logging
 import os
 import secrets
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
 from src.common.models import Job
 from src.common.trace import generate_trace_id, create_leg
 from src.common.flow import generate_flow_id
@@ -31,13 +38,17 @@ def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
 
     Returns a flat dict with at minimum 'job_parameters_b64'.
     """
+    # Direct invoke (the common case): event is already the payload
+    if "job_parameters_b64" in event:
+        return event
+
     # SNS: unwrap first record's Message
     if "Records" in event:
         records = event["Records"]
         if records and "Sns" in records[0]:
             message = records[0]["Sns"].get("Message", "{}")
             if isinstance(message, str):
-                return json.loads(message)
+                return _loads(message)
             return message
 
     # API Gateway format 2.0: requestContext.http
@@ -47,7 +58,7 @@ def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
             return {"_apigw_error": f"Method {method} not allowed"}
         body = event.get("body", "")
         if isinstance(body, str):
-            return json.loads(body) if body else {}
+            return _loads(body) if body else {}
         return body if isinstance(body, dict) else {}
 
     # API Gateway format 1.0: httpMethod
@@ -56,7 +67,7 @@ def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
             return {"_apigw_error": f"Method {event['httpMethod']} not allowed"}
         body = event.get("body", "")
         if isinstance(body, str):
-            return json.loads(body) if body else {}
+            return _loads(body) if body else {}
         return body if isinstance(body, dict) else {}
 
     # Direct invoke: event is the payload
@@ -108,18 +119,22 @@ def process_job_and_insert_orders(
         internal_bucket=internal_bucket,
     )
 
-    # Step 3: Upload
-    upload_orders(repackaged, run_id, internal_bucket)
-
-    # Step 4: Insert into DynamoDB
-    insert_orders(
-        job=job,
-        run_id=run_id,
-        flow_id=flow_id,
-        trace_id=trace_id,
-        repackaged_orders=repackaged,
-        internal_bucket=internal_bucket,
-    )
+    # Steps 3 + 4: Upload to S3 and insert into DynamoDB. They are
+    # independent, and the orchestrator only starts on the init trigger
+    # written after both finish.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        uploaded = pool.submit(upload_orders, repackaged, run_id, internal_bucket)
+        inserted = pool.submit(
+            insert_orders,
+            job=job,
+            run_id=run_id,
+            flow_id=flow_id,
+            trace_id=trace_id,
+            repackaged_orders=repackaged,
+            internal_bucket=internal_bucket,
+        )
+        uploaded.result()
+        inserted.result()
 
     # PR comments disabled — engine has no PR responsibility (AC-5).
     # iac-ci owns entire PR comment lifecycle.
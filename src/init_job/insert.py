@@ -1,10 +1,19 @@
 """Insert orders into DynamoDB and write initial job event."""
 
-import base64
 import json
 import time
 from typing import Dict, List
 
+try:
+    import pybase64 as base64
+except ImportError:  # pragma: no cover
+    import base64
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from src.common import dynamodb
 from src.common.models import Job, JOB_ORDER_NAME, QUEUED
 
@@ -22,6 +31,15 @@ def insert_orders(
     now = int(time.time())
     ttl = now + 86400  # 1 day
 
+    # Job-level values shared by every order
+    s3_prefix = f"s3://{internal_bucket}/tmp/exec/{run_id}/"
+    job_repo = job.git_repo
+    job_commit = job.commit_hash
+    job_token_location = job.git_token_location
+    job_ssh_key_location = job.git_ssh_key_location
+
+    # Collected first, then written in 25-item BatchWriteItem requests
+    orders_data: Dict[str, dict] = {}
     for i, order in enumerate(job.orders):
         order_info = repackaged_orders[i]
         order_num = order_info["order_num"]
@@ -30,19 +48,23 @@ def insert_orders(
         # Build git b64 if using git source
         git_b64 = None
         if not order.s3_location:
-            commit = order.commit_hash or job.commit_hash
+            commit = order.commit_hash or job_commit
             git_data = {
-                "repo": order.git_repo or job.git_repo,
-                "token_location": job.git_token_location,
+                "repo": order.git_repo or job_repo,
+                "token_location": job_token_location,
                 "folder": order.git_folder or "",
             }
-            if job.git_ssh_key_location:
-                git_data["ssh_key_location"] = job.git_ssh_key_location
+            if job_ssh_key_location:
+                git_data["ssh_key_location"] = job_ssh_key_location
             if commit:
                 git_data["commit_hash"] = commit
-            git_b64 = base64.b64encode(json.dumps(git_data).encode()).decode()
+            if orjson is not None:
+                git_json = orjson.dumps(git_data)
+            else:
+                git_json = json.dumps(git_data).encode()
+            git_b64 = base64.b64encode(git_json).decode()
 
-        s3_location = f"s3://{internal_bucket}/tmp/exec/{run_id}/{order_num}/exec.zip"
+        s3_location = f"{s3_prefix}{order_num}/exec.zip"
 
         order_data = {
             "trace_id": trace_id,
@@ -68,12 +90,13 @@ def insert_orders(
         if sops_key_ssm_path:
             order_data["sops_key_ssm_path"] = sops_key_ssm_path
 
-        dynamodb.put_order(
-            run_id=run_id,
-            order_num=order_num,
-            order_data=order_data,
-            dynamodb_resource=dynamodb_resource,
-        )
+        orders_data[order_num] = order_data
+
+    dynamodb.put_orders_bulk(
+        run_id=run_id,
+        orders=orders_data,
+        dynamodb_resource=dynamodb_resource,
+    )
 
     # Write initial job-level event
     dynamodb.put_event(
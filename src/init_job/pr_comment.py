@@ -6,6 +6,12 @@ from src.common.models import Job, QUEUED
 from src.common.vcs.helper import VcsHelper
 
 
+# Tree glyphs for the order summary; every order starts out queued
+_MID = "\u251c\u2500 "
+_END = "\u2514\u2500 "
+_QUEUED_SUFFIX = f": {QUEUED}"
+
+
 def _build_comment_body(
     job: Job,
     run_id: str,
@@ -14,21 +20,16 @@ def _build_comment_body(
     repackaged_orders: List[Dict],
 ) -> str:
     """Build the initial PR comment body with order summary."""
-    lines = []
-
-    # Order summary table
-    lines.append("**Order Summary**")
-    lines.append("")
-
-    for i, order_info in enumerate(repackaged_orders):
-        name = order_info["order_name"]
-        prefix = "\u2514\u2500" if i == len(repackaged_orders) - 1 else "\u251c\u2500"
-        lines.append(f"{prefix} {name}: {QUEUED}")
+    last = len(repackaged_orders) - 1
+    lines = ["**Order Summary**", ""]
+    lines.extend([
+        f"{_END if i == last else _MID}{order_info['order_name']}{_QUEUED_SUFFIX}"
+        for i, order_info in enumerate(repackaged_orders)
+    ])
 
     # Tag block on last line for search
-    tag_line = VcsHelper.format_tags(search_tag, [f"#{run_id}", f"#{flow_id}"])
     lines.append("")
-    lines.append(tag_line)
+    lines.append(VcsHelper.format_tags(search_tag, [f"#{run_id}", f"#{flow_id}"]))
 
     return "\n".join(lines)
 
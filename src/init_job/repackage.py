@@ -7,16 +7,17 @@ from typing import Dict, List, Optional
 
 from src.common.bundler import OrderBundler
 from src.common.code_source import (
-    fetch_ssm_values,
-    fetch_secret_values,
-    clone_repo,
+    fetch_all_credentials,
+    clone_all,
     extract_folder,
     group_git_orders,
     fetch_code_s3,
     zip_directory,
     resolve_git_credentials,
+    release_ssh_key,
 )
 from src.common.models import Job, Order
+from src.common.parallel import run_parallel
 from src.common import s3 as s3_ops
 from src.common.sops import _generate_age_key, store_sops_key_ssm
 
@@ -35,9 +36,10 @@ def _process_order(
     order_num = str(order_index + 1).zfill(4)
     order_name = order.order_name or f"order-{order_num}"
 
-    # Fetch credentials
-    ssm_values = fetch_ssm_values(order.ssm_paths or [])
-    secret_values = fetch_secret_values(order.secret_manager_paths or [])
+    # Fetch SSM and Secrets Manager values concurrently
+    ssm_values, secret_values = fetch_all_credentials(
+        order.ssm_paths or [], order.secret_manager_paths or [],
+    )
 
     # Generate presigned callback URL
     callback_url = s3_ops.generate_callback_presigned_url(
@@ -51,7 +53,7 @@ def _process_order(
     sops_key = order.sops_key
     sops_key_ssm_path = None
     if not sops_key:
-        public_key, private_key_content, _key_file = _generate_age_key()
+        public_key, private_key_content = _generate_age_key()
         sops_key = public_key
         sops_key_ssm_path = store_sops_key_ssm(run_id, order_num, private_key_content)
 
@@ -100,6 +102,22 @@ def repackage_orders(
     results: List[Optional[Dict]] = [None] * len(job.orders)
     shared_clone_dirs: List[str] = []
 
+    def _repackage_one(i: int, order: Order, clone_dir: Optional[str]) -> None:
+        if clone_dir is not None:
+            code_dir = extract_folder(clone_dir, order.git_folder)
+        else:
+            code_dir = fetch_code_s3(order.s3_location)
+        results[i] = _process_order(
+            job=job,
+            order=order,
+            order_index=i,
+            code_dir=code_dir,
+            run_id=run_id,
+            trace_id=trace_id,
+            flow_id=flow_id,
+            internal_bucket=internal_bucket,
+        )
+
     try:
         # Phase 1: Group git orders and clone once per unique (repo, commit_hash)
         git_groups, s3_indices = group_git_orders(job.orders, job)
@@ -110,42 +128,22 @@ def repackage_orders(
             ssh_key_location=job.git_ssh_key_location,
         )
 
-        for (repo, commit_hash), order_entries in git_groups.items():
-            clone_dir = clone_repo(
-                repo=repo,
-                token=token,
-                commit_hash=commit_hash,
-                ssh_key_path=ssh_key_path,
-            )
-            shared_clone_dirs.append(clone_dir)
-
-            for i, order in order_entries:
-                code_dir = extract_folder(clone_dir, order.git_folder)
-                results[i] = _process_order(
-                    job=job,
-                    order=order,
-                    order_index=i,
-                    code_dir=code_dir,
-                    run_id=run_id,
-                    trace_id=trace_id,
-                    flow_id=flow_id,
-                    internal_bucket=internal_bucket,
-                )
-
-        # Phase 2: Process S3-sourced orders (unchanged)
-        for i in s3_indices:
-            order = job.orders[i]
-            code_dir = fetch_code_s3(order.s3_location)
-            results[i] = _process_order(
-                job=job,
-                order=order,
-                order_index=i,
-                code_dir=code_dir,
-                run_id=run_id,
-                trace_id=trace_id,
-                flow_id=flow_id,
-                internal_bucket=internal_bucket,
-            )
+        try:
+            clone_dirs = clone_all(git_groups, token=token, ssh_key_path=ssh_key_path)
+        finally:
+            # Only the clones need the key; checkouts are complete by now
+            release_ssh_key(ssh_key_path)
+        shared_clone_dirs.extend(clone_dirs.values())
+
+        # Phase 2: Process every order (git and S3 sourced) concurrently;
+        # each works in its own code dir and fills its own results slot
+        tasks = [
+            (i, order, clone_dirs[key])
+            for key, order_entries in git_groups.items()
+            for i, order in order_entries
+        ]
+        tasks.extend((i, job.orders[i], None) for i in s3_indices)
+        run_parallel(_repackage_one, tasks)
     finally:
         # Clean up shared clone directories
         for clone_dir in shared_clone_dirs:
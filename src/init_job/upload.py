@@ -1,25 +1,35 @@
 """Upload repackaged orders to S3."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from src.common import s3 as s3_ops
 
+# Orders uploaded at once; each upload may itself use several part threads
+UPLOAD_MAX_WORKERS = 8
+
 
 def upload_orders(
     repackaged_orders: List[Dict],
     run_id: str,
     bucket: str,
 ) -> None:
-    """Upload each repackaged order's exec.zip to S3.
+    """Upload each repackaged order's exec.zip to S3, several at a time.
 
     Expected path: tmp/exec/<run_id>/<order_num>/exec.zip
     """
-    for order_info in repackaged_orders:
-        if order_info.get("zip_path") is None:
-            continue
+    pending = [o for o in repackaged_orders if o.get("zip_path") is not None]
+    if not pending:
+        return
+
+    def _upload(order_info: Dict) -> None:
         s3_ops.upload_exec_zip(
             bucket=bucket,
             run_id=run_id,
             order_num=order_info["order_num"],
             file_path=order_info["zip_path"],
         )
+
+    with ThreadPoolExecutor(max_workers=min(UPLOAD_MAX_WORKERS, len(pending))) as pool:
+        # list() re-raises the first failed upload
+        list(pool.map(_upload, pending))
@@ -13,26 +13,34 @@ def validate_orders(job: Job) -> List[str]:
     if not job.orders:
         return ["Job has no orders"]
 
-    for i, order in enumerate(job.orders):
-        order_label = order.order_name or f"order[{i}]"
+    # Job-level code source fields are the same for every order
+    job_has_token = bool(job.git_token_location)
+    job_has_git = bool(job.git_repo) and job_has_token
 
+    for i, order in enumerate(job.orders):
         # cmds must exist and be non-empty
         if not order.cmds:
-            return [f"{order_label}: cmds is empty or missing"]
+            error = "cmds is empty or missing"
 
         # timeout must be present and positive
-        if not order.timeout or order.timeout <= 0:
-            return [f"{order_label}: timeout is missing or invalid"]
+        elif not order.timeout or order.timeout <= 0:
+            error = "timeout is missing or invalid"
 
         # execution_target must be valid
-        if order.execution_target not in EXECUTION_TARGETS:
-            return [f"{order_label}: invalid execution_target '{order.execution_target}' "
-                    f"(must be one of {sorted(EXECUTION_TARGETS)})"]
+        elif order.execution_target not in EXECUTION_TARGETS:
+            error = (f"invalid execution_target '{order.execution_target}' "
+                     f"(must be one of {sorted(EXECUTION_TARGETS)})")
 
         # Must have a code source: s3_location OR (git_repo + git_token_location from job)
-        has_s3 = bool(order.s3_location)
-        has_git = bool(order.git_repo or job.git_repo) and bool(job.git_token_location)
-        if not has_s3 and not has_git:
-            return [f"{order_label}: no code source (need s3_location or git_repo + git_token_location)"]
+        elif not order.s3_location and not (
+            job_has_git or (order.git_repo and job_has_token)
+        ):
+            error = "no code source (need s3_location or git_repo + git_token_location)"
+
+        else:
+            continue
+
+        # The label is only built for the order that fails
+        return [f"{order.order_name or f'order[{i}]'}: {error}"]
 
     return []
@@ -7,9 +7,8 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List
 
-import boto3
-
 from src.common import dynamodb
+from src.common.clients import get_client
 from src.common.models import RUNNING
 
 logger = logging.getLogger(__name__)
@@ -17,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 def _dispatch_lambda(order: dict, run_id: str, internal_bucket: str) -> str:
     """Invoke the worker Lambda for an order. Returns execution ARN/request ID."""
-    lambda_client = boto3.client("lambda")
+    lambda_client = get_client("lambda")
     function_name = os.environ["AWS_EXE_SYS_WORKER_LAMBDA"]
 
     payload = {
@@ -37,7 +36,7 @@ def _dispatch_lambda(order: dict, run_id: str, internal_bucket: str) -> str:
 
 def _dispatch_codebuild(order: dict, run_id: str, internal_bucket: str) -> str:
     """Start a CodeBuild project for an order. Returns build ID."""
-    codebuild_client = boto3.client("codebuild")
+    codebuild_client = get_client("codebuild")
     project_name = os.environ["AWS_EXE_SYS_CODEBUILD_PROJECT"]
 
     env_overrides = [
@@ -58,7 +57,7 @@ def _dispatch_codebuild(order: dict, run_id: str, internal_bucket: str) -> str:
 
 def _dispatch_ssm(order: dict, run_id: str, internal_bucket: str) -> str:
     """Send SSM Run Command for an order. Returns command ID."""
-    ssm_client = boto3.client("ssm")
+    ssm_client = get_client("ssm")
     document_name = order.get("ssm_document_name") or os.environ["AWS_EXE_SYS_SSM_DOCUMENT"]
 
     parameters = {
@@ -101,7 +100,7 @@ def _start_watchdog(
     internal_bucket: str,
 ) -> str:
     """Start the watchdog Step Function for timeout safety. Returns execution ARN."""
-    sfn_client = boto3.client("stepfunctions")
+    sfn_client = get_client("stepfunctions")
     state_machine_arn = os.environ.get("AWS_EXE_SYS_WATCHDOG_SFN", "")
 
     order_num = order.get("order_num", "")
@@ -131,7 +130,11 @@ def _dispatch_single(
     internal_bucket: str,
     dynamodb_resource=None,
 ) -> dict:
-    """Dispatch a single order (Lambda, CodeBuild, or SSM) + start watchdog."""
+    """Dispatch a single order (Lambda, CodeBuild, or SSM) + start watchdog.
+
+    The "dispatched" event is written by dispatch_orders, batched with the
+    events of every other order in the same call.
+    """
     order_num = order.get("order_num", "")
     order_name = order.get("order_name", order_num)
 
@@ -160,21 +163,6 @@ def _dispatch_single(
         dynamodb_resource=dynamodb_resource,
     )
 
-    # Write order event
-    dynamodb.put_event(
-        trace_id=trace_id,
-        order_name=order_name,
-        event_type="dispatched",
-        status=RUNNING,
-        extra_fields={
-            "run_id": run_id,
-            "order_num": order_num,
-            "flow_id": flow_id,
-            "execution_url": execution_id,
-        },
-        dynamodb_resource=dynamodb_resource,
-    )
-
     return {
         "order_num": order_num,
         "order_name": order_name,
@@ -224,4 +212,28 @@ def dispatch_orders(
                     order.get("order_num"), e,
                 )
 
+    # One BatchWriteItem per 25 events instead of a PutItem per order.
+    # batch_writer resends UnprocessedItems; anything that still fails
+    # propagates, as the per-order put_event did, so the run is retried
+    # rather than left running with no dispatch on the event trail.
+    if results:
+        dynamodb.put_events_bulk(
+            [
+                {
+                    "trace_id": trace_id,
+                    "order_name": result["order_name"],
+                    "event_type": "dispatched",
+                    "status": RUNNING,
+                    "extra_fields": {
+                        "run_id": run_id,
+                        "order_num": result["order_num"],
+                        "flow_id": flow_id,
+                        "execution_url": result["execution_id"],
+                    },
+                }
+                for result in results
+            ],
+            dynamodb_resource=dynamodb_resource,
+        )
+
     return results
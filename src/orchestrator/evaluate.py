@@ -7,6 +7,14 @@ from src.common.models import QUEUED, SUCCEEDED, FAILED, TIMED_OUT
 TERMINAL_STATUSES = frozenset({SUCCEEDED, FAILED, TIMED_OUT})
 FAILED_STATUSES = frozenset({FAILED, TIMED_OUT})
 
+# Dependency states; anything not listed (queued, running, unknown) is pending
+_DEP_SUCCEEDED, _DEP_FAILED, _DEP_PENDING = 0, 1, 2
+_DEP_STATE = {
+    SUCCEEDED: _DEP_SUCCEEDED,
+    FAILED: _DEP_FAILED,
+    TIMED_OUT: _DEP_FAILED,
+}
+
 
 def evaluate_orders(orders: List[dict]) -> Tuple[List[dict], List[dict], List[dict]]:
     """Evaluate dependency graph and classify queued orders.
@@ -35,33 +43,18 @@ def evaluate_orders(orders: List[dict]) -> Tuple[List[dict], List[dict], List[di
             continue
 
         must_succeed = order.get("must_succeed", True)
-        all_succeeded = True
-        any_dep_running = False
-        any_dep_failed = False
-
+        # A failed dep decides a must_succeed order; otherwise a pending dep
+        # decides it. Failed deps of an optional order don't block it.
+        target = ready
         for dep_id in deps:
-            dep_status = status_by_queue_id.get(dep_id, QUEUED)
-
-            if dep_status == SUCCEEDED:
-                continue
-            elif dep_status in FAILED_STATUSES:
-                any_dep_failed = True
-                all_succeeded = False
-            elif dep_status in (QUEUED, "running"):
-                any_dep_running = True
-                all_succeeded = False
-            else:
-                any_dep_running = True
-                all_succeeded = False
-
-        if all_succeeded:
-            ready.append(order)
-        elif any_dep_failed and must_succeed:
-            failed_deps.append(order)
-        elif any_dep_running or not any_dep_failed:
-            waiting.append(order)
-        else:
-            # Deps failed but must_succeed=False — still ready
-            ready.append(order)
+            state = _DEP_STATE.get(status_by_queue_id.get(dep_id, QUEUED), _DEP_PENDING)
+            if state == _DEP_FAILED and must_succeed:
+                target = failed_deps
+                break
+            if state == _DEP_PENDING:
+                target = waiting
+                if not must_succeed:
+                    break
+        target.append(order)
 
     return ready, failed_deps, waiting
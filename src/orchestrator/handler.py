@@ -1,12 +1,12 @@
 """Lambda entrypoint for orchestrator — Part 2: execute_orders."""
 
+import json
 import logging
 import os
-import re
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List
 
 from src.common import dynamodb
-from src.common.models import FAILED
+from src.common.models import FAILED, RUNNING
 from src.orchestrator.lock import acquire_lock, release_lock
 from src.orchestrator.read_state import read_state
 from src.orchestrator.evaluate import evaluate_orders
@@ -15,16 +15,23 @@ from src.orchestrator.finalize import check_and_finalize
 
 logger = logging.getLogger(__name__)
 
+_CALLBACK_PREFIX = "tmp/callbacks/runs/"
+
+# Run outcomes whose SQS messages are reported back as batch item failures
+_RETRY_STATUSES = frozenset({"skipped", "error"})
+
 
 def _parse_run_id_from_s3_key(key: str) -> str:
     """Extract run_id from S3 key path.
 
     Expected format: tmp/callbacks/runs/<run_id>/<order_num>/result.json
     """
-    match = re.search(r"tmp/callbacks/runs/([^/]+)/", key)
-    if match:
-        return match.group(1)
-    return ""
+    start = key.find(_CALLBACK_PREFIX)
+    if start < 0:
+        return ""
+    start += len(_CALLBACK_PREFIX)
+    end = key.find("/", start)
+    return key[start:end] if end > start else ""
 
 
 def execute_orders(run_id: str, dynamodb_resource=None, s3_client=None) -> dict:
@@ -52,7 +59,7 @@ def execute_orders(run_id: str, dynamodb_resource=None, s3_client=None) -> dict:
     # Evaluate dependencies
     ready, failed_deps, waiting = evaluate_orders(orders)
 
-    # Mark failed-due-to-deps orders
+    # Mark failed-due-to-deps orders; their events go out in one batch
     for order in failed_deps:
         dynamodb.update_order_status(
             run_id=run_id,
@@ -63,18 +70,25 @@ def execute_orders(run_id: str, dynamodb_resource=None, s3_client=None) -> dict:
         )
         order["status"] = FAILED
 
-        dynamodb.put_event(
-            trace_id=trace_id,
-            order_name=order.get("order_name", ""),
-            event_type="dependency_failed",
-            status=FAILED,
-            extra_fields={"run_id": run_id},
+    if failed_deps:
+        dynamodb.put_events_bulk(
+            [
+                {
+                    "trace_id": trace_id,
+                    "order_name": order.get("order_name", ""),
+                    "event_type": "dependency_failed",
+                    "status": FAILED,
+                    "extra_fields": {"run_id": run_id},
+                }
+                for order in failed_deps
+            ],
             dynamodb_resource=dynamodb_resource,
         )
 
     # Dispatch ready orders
+    all_orders = orders
     if ready:
-        dispatch_orders(
+        dispatched = dispatch_orders(
             ready_orders=ready,
             run_id=run_id,
             flow_id=flow_id,
@@ -82,10 +96,17 @@ def execute_orders(run_id: str, dynamodb_resource=None, s3_client=None) -> dict:
             internal_bucket=internal_bucket,
             dynamodb_resource=dynamodb_resource,
         )
+        if len(dispatched) == len(ready):
+            # Every dispatch was written as RUNNING; mirror that in memory
+            for order in ready:
+                order["status"] = RUNNING
+        else:
+            # A dispatch failed part-way; its stored status is unknown
+            all_orders = dynamodb.get_all_orders(
+                run_id, dynamodb_resource=dynamodb_resource,
+            )
 
     # Check if all done and finalize
-    # Re-read to get latest statuses after dispatch
-    all_orders = dynamodb.get_all_orders(run_id, dynamodb_resource=dynamodb_resource)
     finalized = check_and_finalize(
         orders=all_orders,
         run_id=run_id,
@@ -104,21 +125,49 @@ def execute_orders(run_id: str, dynamodb_resource=None, s3_client=None) -> dict:
     }
 
 
-def handler(event: Dict[str, Any], context: Any = None) -> dict:
-    """Lambda entrypoint — triggered by S3 ObjectCreated event."""
-    # Parse run_id from S3 event
-    run_id = ""
-    if "Records" in event:
-        for record in event["Records"]:
-            s3_key = record.get("s3", {}).get("object", {}).get("key", "")
-            run_id = _parse_run_id_from_s3_key(s3_key)
-            if run_id:
-                break
-
-    if not run_id:
-        logger.error("Could not extract run_id from event: %s", event)
-        return {"status": "error", "message": "Missing run_id"}
+def _s3_keys(event: Dict[str, Any]) -> Iterator[str]:
+    """Yield object keys from S3 notification records.
 
+    Handles direct S3 events and SQS records whose body is an S3 event.
+    """
+    for record in event.get("Records", []):
+        if "s3" in record:
+            yield record["s3"].get("object", {}).get("key", "")
+        elif "body" in record:
+            try:
+                body = json.loads(record["body"])
+            except (TypeError, ValueError):
+                continue
+            if isinstance(body, dict):
+                yield from _s3_keys(body)
+
+
+def _run_ids(event: Dict[str, Any]) -> List[str]:
+    """Unique run_ids in the event, in the order they first appear."""
+    return list(dict.fromkeys(
+        run_id for run_id in map(_parse_run_id_from_s3_key, _s3_keys(event)) if run_id
+    ))
+
+
+def _batch_item_failures(event: Dict[str, Any], results: Dict[str, dict]) -> List[dict]:
+    """SQS messages to redeliver: those carrying a run that was skipped or failed.
+
+    A run skipped because another invocation held its lock may have been
+    read before this callback landed, so its message is retried too.
+    """
+    failures = []
+    for record in event.get("Records", []):
+        message_id = record.get("messageId")
+        if not message_id:
+            continue
+        run_ids = map(_parse_run_id_from_s3_key, _s3_keys({"Records": [record]}))
+        if any(results.get(run_id, {}).get("status") in _RETRY_STATUSES for run_id in run_ids):
+            failures.append({"itemIdentifier": message_id})
+    return failures
+
+
+def _execute_run(run_id: str) -> dict:
+    """Run execute_orders for one run_id under its lock."""
     # Acquire lock
     # Use placeholder flow_id/trace_id — will be read from orders
     if not acquire_lock(run_id, flow_id="", trace_id=""):
@@ -131,3 +180,29 @@ def handler(event: Dict[str, Any], context: Any = None) -> dict:
         logger.exception("Orchestrator failed for run_id=%s", run_id)
         release_lock(run_id)
         return {"status": "error", "message": str(e)}
+
+
+def handler(event: Dict[str, Any], context: Any = None) -> dict:
+    """Lambda entrypoint — triggered by S3 ObjectCreated events via SQS.
+
+    Callbacks arrive in batches; each run_id in a batch is orchestrated
+    once, however many of its results.json writes the batch carries.
+    Messages for runs that were skipped or failed are returned in
+    batchItemFailures so SQS redelivers them.
+    """
+    run_ids = _run_ids(event)
+    if not run_ids:
+        logger.error("Could not extract run_id from event: %s", event)
+        return {"status": "error", "message": "Missing run_id"}
+
+    results = {run_id: _execute_run(run_id) for run_id in run_ids}
+    if len(run_ids) == 1:
+        response = dict(results[run_ids[0]])
+    else:
+        response = {"status": "ok", "runs": results}
+
+    # SQS batches: report skipped/failed runs so only their messages return
+    # to the queue (the event source mapping uses ReportBatchItemFailures)
+    if any("messageId" in record for record in event.get("Records", [])):
+        response["batchItemFailures"] = _batch_item_failures(event, results)
+    return response
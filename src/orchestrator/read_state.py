@@ -24,8 +24,7 @@ def read_state(
 
     For running orders, checks S3 for result.json. If found:
     - Parses the result (status + log)
-    - Updates order status in DynamoDB
-    - Writes an order_event
+    - Updates order status and writes an order_event (one transaction)
 
     Returns the full list of order records (updated).
     """
@@ -34,21 +33,25 @@ def read_state(
 
     orders = dynamodb.get_all_orders(run_id, dynamodb_resource=dynamodb_resource)
 
-    for order in orders:
-        status = order.get("status", "")
-
-        # Only check running orders for new results
-        if status != RUNNING:
-            continue
-
-        order_num = order.get("order_num", "")
-        result = s3_ops.read_result(
-            bucket=internal_bucket,
-            run_id=run_id,
-            order_num=order_num,
-            s3_client=s3_client,
+    # Only check running orders for new results
+    running = [o for o in orders if o.get("status", "") == RUNNING]
+    to_read = [o.get("order_num", "") for o in running]
+    if len(to_read) > 1:
+        # One LIST tells us which results exist; GET only those
+        completed = s3_ops.list_completed_orders(
+            bucket=internal_bucket, run_id=run_id, s3_client=s3_client,
         )
-
+        to_read = [num for num in to_read if num in completed]
+    results = s3_ops.read_results_batch(
+        bucket=internal_bucket,
+        run_id=run_id,
+        order_nums=to_read,
+        s3_client=s3_client,
+    )
+
+    for order in running:
+        order_num = order.get("order_num", "")
+        result = results.get(order_num)
         if result is None:
             continue
 
@@ -56,22 +59,16 @@ def read_state(
         new_status = result.get("status", FAILED)
         log_output = result.get("log", "")
 
-        dynamodb.update_order_status(
+        # Status update + order event in one transaction
+        dynamodb.transact_order_completion(
             run_id=run_id,
             order_num=order_num,
             status=new_status,
-            extra_fields={"log": log_output} if log_output else None,
-            dynamodb_resource=dynamodb_resource,
-        )
-
-        # Write order event
-        order_name = order.get("order_name", order_num)
-        dynamodb.put_event(
             trace_id=trace_id or order.get("trace_id", ""),
-            order_name=order_name,
+            order_name=order.get("order_name", order_num),
             event_type="completed",
-            status=new_status,
-            extra_fields={
+            extra_fields={"log": log_output} if log_output else None,
+            event_fields={
                 "run_id": run_id,
                 "order_num": order_num,
             },
@@ -14,8 +14,15 @@ import json
 import logging
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
 from src.common.trace import generate_trace_id, create_leg
 from src.common.flow import generate_flow_id
 from src.common import s3 as s3_ops
@@ -30,13 +37,17 @@ logger = logging.getLogger(__name__)
 
 def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
     """Extract the job payload from any supported invocation source."""
+    # Direct invoke (the common case): event is already the payload
+    if "job_parameters_b64" in event:
+        return event
+
     # SNS
     if "Records" in event:
         records = event["Records"]
         if records and "Sns" in records[0]:
             message = records[0]["Sns"].get("Message", "{}")
             if isinstance(message, str):
-                return json.loads(message)
+                return _loads(message)
             return message
 
     # API Gateway format 2.0: requestContext.http
@@ -46,7 +57,7 @@ def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
             return {"_apigw_error": f"Method {method} not allowed"}
         body = event.get("body", "")
         if isinstance(body, str):
-            return json.loads(body) if body else {}
+            return _loads(body) if body else {}
         return body if isinstance(body, dict) else {}
 
     # API Gateway format 1.0: httpMethod
@@ -55,7 +66,7 @@ def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
             return {"_apigw_error": f"Method {event['httpMethod']} not allowed"}
         body = event.get("body", "")
         if isinstance(body, str):
-            return json.loads(body) if body else {}
+            return _loads(body) if body else {}
         return body if isinstance(body, dict) else {}
 
     return event
@@ -103,18 +114,22 @@ def process_ssm_job(
         internal_bucket=internal_bucket,
     )
 
-    # Step 3: Upload
-    upload_orders(repackaged, run_id, internal_bucket)
-
-    # Step 4: Insert into DynamoDB
-    insert_ssm_orders(
-        job=job,
-        run_id=run_id,
-        flow_id=flow_id,
-        trace_id=trace_id,
-        repackaged_orders=repackaged,
-        internal_bucket=internal_bucket,
-    )
+    # Steps 3 + 4: Upload to S3 and insert into DynamoDB. They are
+    # independent, and the orchestrator only starts on the init trigger
+    # written after both finish.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        uploaded = pool.submit(upload_orders, repackaged, run_id, internal_bucket)
+        inserted = pool.submit(
+            insert_ssm_orders,
+            job=job,
+            run_id=run_id,
+            flow_id=flow_id,
+            trace_id=trace_id,
+            repackaged_orders=repackaged,
+            internal_bucket=internal_bucket,
+        )
+        uploaded.result()
+        inserted.result()
 
     # Step 5: Write init trigger to kick off orchestrator
     s3_ops.write_init_trigger(
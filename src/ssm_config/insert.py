@@ -20,13 +20,16 @@ def insert_ssm_orders(
     """Insert all SSM orders into the DynamoDB orders table and write initial job event."""
     now = int(time.time())
     ttl = now + 86400  # 1 day
+    s3_prefix = f"s3://{internal_bucket}/tmp/exec/{run_id}/"
 
+    # Collected first, then written in 25-item BatchWriteItem requests
+    orders_data: Dict[str, dict] = {}
     for i, order in enumerate(job.orders):
         order_info = repackaged_orders[i]
         order_num = order_info["order_num"]
         order_name = order_info["order_name"]
 
-        s3_location = f"s3://{internal_bucket}/tmp/exec/{run_id}/{order_num}/exec.zip"
+        s3_location = f"{s3_prefix}{order_num}/exec.zip"
 
         order_data = {
             "trace_id": trace_id,
@@ -51,12 +54,13 @@ def insert_ssm_orders(
         if order_info.get("env_dict"):
             order_data["env_dict"] = order_info["env_dict"]
 
-        dynamodb.put_order(
-            run_id=run_id,
-            order_num=order_num,
-            order_data=order_data,
-            dynamodb_resource=dynamodb_resource,
-        )
+        orders_data[order_num] = order_data
+
+    dynamodb.put_orders_bulk(
+        run_id=run_id,
+        orders=orders_data,
+        dynamodb_resource=dynamodb_resource,
+    )
 
     # Write initial job-level event
     dynamodb.put_event(
@@ -2,11 +2,11 @@
 
 import base64
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SsmOrder:
     """Per-order fields for SSM execution."""
 
@@ -28,16 +28,14 @@ class SsmOrder:
     callback_url: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
 
     @classmethod
     def from_dict(cls, data: dict) -> "SsmOrder":
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered)
+        return cls(**{k: data[k] for k in cls._FIELDS if k in data})
 
 
-@dataclass
+@dataclass(slots=True)
 class SsmJob:
     """Job-level fields for SSM config provider."""
 
@@ -52,16 +50,15 @@ class SsmJob:
     job_timeout: int = 3600
 
     def to_dict(self) -> dict:
-        d = asdict(self)
+        d = {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
         d["orders"] = [o.to_dict() for o in self.orders]
-        return {k: v for k, v in d.items() if v is not None}
+        return d
 
     @classmethod
     def from_dict(cls, data: dict) -> "SsmJob":
         orders_data = data.get("orders", [])
         orders = [SsmOrder.from_dict(o) for o in orders_data]
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields and k != "orders"}
+        filtered = {k: data[k] for k in cls._FIELDS if k in data and k != "orders"}
         return cls(orders=orders, **filtered)
 
     def to_b64(self) -> str:
@@ -71,3 +68,8 @@ class SsmJob:
     def from_b64(cls, b64_str: str) -> "SsmJob":
         data = json.loads(base64.b64decode(b64_str).decode())
         return cls.from_dict(data)
+
+
+# Field names computed once at import rather than per to_dict/from_dict call
+SsmOrder._FIELDS = tuple(SsmOrder.__dataclass_fields__)
+SsmJob._FIELDS = tuple(SsmJob.__dataclass_fields__)
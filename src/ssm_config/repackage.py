@@ -8,16 +8,18 @@ from typing import Dict, List, Optional
 
 from src.common.bundler import OrderBundler
 from src.common.code_source import (
-    fetch_ssm_values,
-    fetch_secret_values,
-    clone_repo,
+    fetch_all_credentials,
+    clone_all,
+    detach_file,
     extract_folder,
     group_git_orders,
     fetch_code_s3,
     zip_directory,
     resolve_git_credentials,
+    release_ssh_key,
 )
 from src.common import s3 as s3_ops
+from src.common.parallel import run_parallel
 from src.ssm_config.models import SsmJob, SsmOrder
 
 
@@ -35,9 +37,10 @@ def _process_ssm_order(
     order_num = str(order_index + 1).zfill(4)
     order_name = order.order_name or f"order-{order_num}"
 
-    # Fetch credentials
-    ssm_values = fetch_ssm_values(order.ssm_paths or [])
-    secret_values = fetch_secret_values(order.secret_manager_paths or [])
+    # Fetch SSM and Secrets Manager values concurrently
+    ssm_values, secret_values = fetch_all_credentials(
+        order.ssm_paths or [], order.secret_manager_paths or [],
+    )
 
     # Generate presigned callback URL
     callback_url = s3_ops.generate_callback_presigned_url(
@@ -62,9 +65,13 @@ def _process_ssm_order(
     env_dict = bundler.build_env()
 
     # Write cmds.json and env_vars.json into code dir for the SSM document
-    with open(os.path.join(code_dir, "cmds.json"), "w") as f:
+    cmds_file = os.path.join(code_dir, "cmds.json")
+    env_file = os.path.join(code_dir, "env_vars.json")
+    detach_file(cmds_file)
+    detach_file(env_file)
+    with open(cmds_file, "w") as f:
         json.dump(order.cmds, f)
-    with open(os.path.join(code_dir, "env_vars.json"), "w") as f:
+    with open(env_file, "w") as f:
         json.dump(env_dict, f)
 
     # Zip
@@ -96,6 +103,25 @@ def repackage_ssm_orders(
     results: List[Optional[Dict]] = [None] * len(job.orders)
     shared_clone_dirs: List[str] = []
 
+    def _repackage_one(i: int, order: SsmOrder, clone_dir: Optional[str]) -> None:
+        if clone_dir is not None:
+            code_dir = extract_folder(clone_dir, order.git_folder)
+        elif i in s3_set:
+            code_dir = fetch_code_s3(order.s3_location)
+        else:
+            # Commands-only order: no code source
+            code_dir = tempfile.mkdtemp(prefix="aws-exe-sys-ssm-")
+        results[i] = _process_ssm_order(
+            job=job,
+            order=order,
+            order_index=i,
+            code_dir=code_dir,
+            run_id=run_id,
+            trace_id=trace_id,
+            flow_id=flow_id,
+            internal_bucket=internal_bucket,
+        )
+
     try:
         # Phase 1: Group git orders and clone once per unique (repo, commit_hash)
         git_groups, s3_indices = group_git_orders(job.orders, job)
@@ -106,58 +132,25 @@ def repackage_ssm_orders(
             ssh_key_location=job.git_ssh_key_location,
         )
 
-        for (repo, commit_hash), order_entries in git_groups.items():
-            clone_dir = clone_repo(
-                repo=repo,
-                token=token,
-                commit_hash=commit_hash,
-                ssh_key_path=ssh_key_path,
-            )
-            shared_clone_dirs.append(clone_dir)
-
-            for i, order in order_entries:
-                code_dir = extract_folder(clone_dir, order.git_folder)
-                results[i] = _process_ssm_order(
-                    job=job,
-                    order=order,
-                    order_index=i,
-                    code_dir=code_dir,
-                    run_id=run_id,
-                    trace_id=trace_id,
-                    flow_id=flow_id,
-                    internal_bucket=internal_bucket,
-                )
-
-        # Phase 2: Process S3-sourced orders
-        for i in s3_indices:
-            order = job.orders[i]
-            code_dir = fetch_code_s3(order.s3_location)
-            results[i] = _process_ssm_order(
-                job=job,
-                order=order,
-                order_index=i,
-                code_dir=code_dir,
-                run_id=run_id,
-                trace_id=trace_id,
-                flow_id=flow_id,
-                internal_bucket=internal_bucket,
-            )
-
-        # Phase 3: SSM orders with no code source (commands-only)
-        for i, order in enumerate(job.orders):
-            if results[i] is not None:
-                continue
-            code_dir = tempfile.mkdtemp(prefix="aws-exe-sys-ssm-")
-            results[i] = _process_ssm_order(
-                job=job,
-                order=order,
-                order_index=i,
-                code_dir=code_dir,
-                run_id=run_id,
-                trace_id=trace_id,
-                flow_id=flow_id,
-                internal_bucket=internal_bucket,
-            )
+        try:
+            clone_dirs = clone_all(git_groups, token=token, ssh_key_path=ssh_key_path)
+        finally:
+            # Only the clones need the key; checkouts are complete by now
+            release_ssh_key(ssh_key_path)
+        shared_clone_dirs.extend(clone_dirs.values())
+
+        # Phase 2: Process git, S3 and commands-only orders concurrently;
+        # each works in its own code dir and fills its own results slot
+        s3_set = set(s3_indices)
+        order_clone_dirs: Dict[int, str] = {
+            i: clone_dirs[key]
+            for key, order_entries in git_groups.items()
+            for i, _order in order_entries
+        }
+        run_parallel(
+            _repackage_one,
+            [(i, order, order_clone_dirs.get(i)) for i, order in enumerate(job.orders)],
+        )
 
     finally:
         for clone_dir in shared_clone_dirs:
@@ -7,35 +7,21 @@ import os
 import signal
 import subprocess
 import tempfile
-import zipfile
 from typing import Optional
 
-import boto3
-
 from src.common import dynamodb, sops
+from src.common.code_source import fetch_code_s3
 from src.worker.callback import send_callback
 
 logger = logging.getLogger(__name__)
 
 
 def _download_and_extract(s3_location: str) -> str:
-    """Download exec.zip from S3 and extract to temp directory."""
-    work_dir = tempfile.mkdtemp(prefix="aws-exe-sys-worker-")
-
-    # Parse s3://bucket/key
-    parts = s3_location.replace("s3://", "").split("/", 1)
-    bucket = parts[0]
-    key = parts[1] if len(parts) > 1 else ""
-
-    local_zip = os.path.join(work_dir, "exec.zip")
-    s3_client = boto3.client("s3")
-    s3_client.download_file(bucket, key, local_zip)
+    """Download exec.zip from S3 and extract to temp directory.
 
-    with zipfile.ZipFile(local_zip, "r") as zf:
-        zf.extractall(work_dir)
-    os.unlink(local_zip)
-
-    return work_dir
+    The zip is spooled rather than written into the work dir and read back.
+    """
+    return fetch_code_s3(s3_location)
 
 
 def _decrypt_and_load_env(work_dir: str) -> dict:
@@ -122,7 +122,7 @@ def _write_result(s3, run_id, order_num, status="succeeded", log="done"):
 class TestFullRun:
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
     @patch("src.orchestrator.dispatch._start_watchdog", return_value="arn:watchdog:exec")
     @patch("src.orchestrator.dispatch._dispatch_lambda", return_value="req-123")
@@ -135,7 +135,7 @@ def mock_aws_resources(aws_env):
 class TestInitJobFlow:
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
     @patch("src.common.sops.repackage_order")
     @patch("src.init_job.pr_comment.VcsHelper")
@@ -198,7 +198,7 @@ class TestInitJobFlow:
         assert job_events[0]["event_type"] == "job_started"
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
     @patch("src.common.sops.repackage_order")
     @patch("src.init_job.pr_comment.VcsHelper")
@@ -220,7 +220,7 @@ class TestInitJobFlow:
         mock_vcs_cls.assert_not_called()
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
     @patch("src.common.sops.repackage_order")
     @patch("src.init_job.pr_comment.VcsHelper")
@@ -242,7 +242,7 @@ class TestInitJobFlow:
         assert result["pr_search_tag"]
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
     @patch("src.common.sops.repackage_order")
     @patch("src.init_job.pr_comment.VcsHelper")
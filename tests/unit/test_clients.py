@@ -0,0 +1,33 @@
+"""Unit tests for src/common/clients.py."""
+
+from unittest.mock import patch
+
+from src.common import clients
+
+
+class TestGetClient:
+    def setup_method(self):
+        clients._clients.clear()
+
+    def teardown_method(self):
+        clients._clients.clear()
+
+    @patch("src.common.clients.boto3.client")
+    def test_client_is_cached(self, mock_client):
+        first = clients.get_client("s3")
+        second = clients.get_client("s3")
+        assert first is second
+        mock_client.assert_called_once_with(
+            "s3", region_name=None, config=clients.CLIENT_CONFIG,
+        )
+
+    @patch("src.common.clients.boto3.client")
+    def test_cached_per_service_and_region(self, mock_client):
+        mock_client.side_effect = lambda *a, **kw: object()
+        assert clients.get_client("ssm", "us-east-1") is not clients.get_client("ssm", "us-west-2")
+        assert clients.get_client("ssm", "us-east-1") is not clients.get_client("s3", "us-east-1")
+        assert mock_client.call_count == 3
+
+    def test_config_keeps_connections_alive(self):
+        assert clients.CLIENT_CONFIG.tcp_keepalive is True
+        assert clients.CLIENT_CONFIG.max_pool_connections == 64
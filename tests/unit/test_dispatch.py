@@ -169,6 +169,49 @@ class TestDispatchOrders:
 
         assert len(results) == 3
         assert mock_lambda.call_count == 3
+        events = dynamodb.get_events("trace-1", dynamodb_resource=ddb_resource)
+        assert sorted(e["order_name"] for e in events) == ["order-0", "order-1", "order-2"]
+
+    @patch("src.orchestrator.dispatch._start_watchdog")
+    @patch("src.orchestrator.dispatch._dispatch_lambda")
+    def test_records_watchdog_and_event(self, mock_lambda, mock_watchdog, ddb_resource):
+        mock_lambda.return_value = "req-123"
+        mock_watchdog.return_value = "arn:sfn:exec-1"
+        dynamodb.put_order("run-1", "0001", {
+            "order_name": "test", "status": "queued",
+        }, dynamodb_resource=ddb_resource)
+
+        order = {"order_num": "0001", "order_name": "test", "execution_target": "lambda"}
+        dispatch_orders(
+            [order], "run-1", "flow-1", "trace-1",
+            "test-internal", dynamodb_resource=ddb_resource,
+        )
+
+        updated = dynamodb.get_order("run-1", "0001", dynamodb_resource=ddb_resource)
+        assert updated["step_function_url"] == "arn:sfn:exec-1"
+        events = dynamodb.get_events("trace-1", dynamodb_resource=ddb_resource)
+        assert [e["event_type"] for e in events] == ["dispatched"]
+        assert events[0]["execution_url"] == "req-123"
+
+    @patch("src.orchestrator.dispatch.dynamodb.put_events_bulk")
+    @patch("src.orchestrator.dispatch._start_watchdog")
+    @patch("src.orchestrator.dispatch._dispatch_lambda")
+    def test_event_write_failure_raises(
+        self, mock_lambda, mock_watchdog, mock_bulk, ddb_resource,
+    ):
+        mock_lambda.return_value = "req-123"
+        mock_watchdog.return_value = "arn:sfn:exec-1"
+        mock_bulk.side_effect = RuntimeError("throttled")
+        dynamodb.put_order("run-1", "0001", {
+            "order_name": "test", "status": "queued",
+        }, dynamodb_resource=ddb_resource)
+
+        order = {"order_num": "0001", "order_name": "test", "execution_target": "lambda"}
+        with pytest.raises(RuntimeError, match="throttled"):
+            dispatch_orders(
+                [order], "run-1", "flow-1", "trace-1",
+                "test-internal", dynamodb_resource=ddb_resource,
+            )
 
     def test_empty_list(self, ddb_resource):
         results = dispatch_orders(
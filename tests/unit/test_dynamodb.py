@@ -115,6 +115,16 @@ class TestOrdersTable:
         results = dynamodb.get_all_orders("run-1", dynamodb_resource=ddb_resource)
         assert len(results) == 3
 
+    def test_get_all_orders_interns_status(self, ddb_resource):
+        from src.common.models import QUEUED
+
+        dynamodb.put_order(
+            "run-1", "001", {"order_name": "a", "status": "queued"},
+            dynamodb_resource=ddb_resource,
+        )
+        results = dynamodb.get_all_orders("run-1", dynamodb_resource=ddb_resource)
+        assert results[0]["status"] is QUEUED
+
     def test_update_order_status(self, ddb_resource):
         dynamodb.put_order(
             "run-1", "001",
@@ -144,6 +154,57 @@ class TestOrdersTable:
         assert result["execution_url"] == "https://example.com"
 
 
+    def test_update_order_status_serializes_types(self, ddb_resource):
+        dynamodb.put_order(
+            "run-1", "001", {"status": "queued"}, dynamodb_resource=ddb_resource,
+        )
+        # No explicit resource: goes through the low-level client path
+        dynamodb.update_order_status(
+            "run-1", "001", "failed",
+            extra_fields={"exit-code": 2, "log": {"lines": ["a", "b"]}, "retry": True},
+        )
+        result = dynamodb.get_order("run-1", "001", dynamodb_resource=ddb_resource)
+        assert result["status"] == "failed"
+        assert result["exit-code"] == 2
+        assert result["log"] == {"lines": ["a", "b"]}
+        assert result["retry"] is True
+
+    def test_put_orders_bulk(self, ddb_resource):
+        orders = {
+            f"{i:04d}": {"order_name": f"order-{i}", "status": "queued"}
+            for i in range(1, 31)
+        }
+        dynamodb.put_orders_bulk("run-1", orders, dynamodb_resource=ddb_resource)
+        results = dynamodb.get_all_orders("run-1", dynamodb_resource=ddb_resource)
+        assert len(results) == 30
+        assert results[0]["pk"] == "run-1:0001"
+        assert results[29]["order_name"] == "order-30"
+
+
+class TestTransactOrderCompletion:
+    @pytest.mark.parametrize("explicit_resource", [True, False])
+    def test_updates_order_and_writes_event(self, ddb_resource, explicit_resource):
+        resource = ddb_resource if explicit_resource else None
+        dynamodb.put_order("run-1", "001", {"status": "running"},
+                           dynamodb_resource=ddb_resource)
+
+        dynamodb.transact_order_completion(
+            run_id="run-1", order_num="001", status="succeeded",
+            trace_id="trace-1", order_name="deploy-vpc", event_type="completed",
+            extra_fields={"log": "done"},
+            event_fields={"run_id": "run-1", "order_num": "001"},
+            dynamodb_resource=resource,
+        )
+
+        order = dynamodb.get_order("run-1", "001", dynamodb_resource=ddb_resource)
+        assert order["status"] == "succeeded"
+        assert order["log"] == "done"
+        events = dynamodb.get_events("trace-1", dynamodb_resource=ddb_resource)
+        assert len(events) == 1
+        assert events[0]["event_type"] == "completed"
+        assert events[0]["order_num"] == "001"
+
+
 class TestOrderEventsTable:
     def test_put_and_get_events(self, ddb_resource):
         dynamodb.put_event(
@@ -214,6 +275,18 @@ class TestOrderEventsTable:
         assert events[0]["execution_url"] == "https://exec.example.com"
 
 
+    def test_put_events_bulk(self, ddb_resource):
+        dynamodb.put_events_bulk([
+            {"trace_id": "t1", "order_name": "a", "event_type": "dispatched",
+             "status": "running"},
+            {"trace_id": "t1", "order_name": "b", "event_type": "dispatched",
+             "status": "running", "extra_fields": {"run_id": "run-1"}},
+        ], dynamodb_resource=ddb_resource)
+        events = dynamodb.get_events("t1", dynamodb_resource=ddb_resource)
+        assert sorted(e["order_name"] for e in events) == ["a", "b"]
+        assert dynamodb.get_events("t1", "b", dynamodb_resource=ddb_resource)[0]["run_id"] == "run-1"
+
+
 class TestLocksTable:
     def test_acquire_lock(self, ddb_resource):
         acquired = dynamodb.acquire_lock(
@@ -272,6 +345,51 @@ class TestLocksTable:
         assert lock is None
 
 
+class TestGetTable:
+    def test_default_table_is_cached(self, ddb_resource):
+        first = dynamodb._get_table("AWS_EXE_SYS_ORDERS_TABLE")
+        second = dynamodb._get_table("AWS_EXE_SYS_ORDERS_TABLE")
+        assert first is second
+        assert first.name == "test-orders"
+
+    def test_explicit_resource_bypasses_cache(self, ddb_resource):
+        cached = dynamodb._get_table("AWS_EXE_SYS_ORDERS_TABLE")
+        table = dynamodb._get_table("AWS_EXE_SYS_ORDERS_TABLE", ddb_resource)
+        assert table is not cached
+
+    def test_default_table_works_end_to_end(self, ddb_resource):
+        dynamodb.put_order("run-9", "001", {"status": "queued"})
+        assert dynamodb.get_order("run-9", "001")["status"] == "queued"
+
+    def test_default_resource_keeps_connections_alive(self, ddb_resource):
+        config = dynamodb._get_resource().meta.client.meta.config
+        assert config.tcp_keepalive is True
+
+
+class TestPaginate:
+    def test_follows_last_evaluated_key(self):
+        table = MagicMock()
+        table.query.side_effect = [
+            {"Items": [{"n": 1}], "LastEvaluatedKey": {"pk": "a"}},
+            {"Items": [{"n": 2}], "LastEvaluatedKey": {"pk": "b"}},
+            {"Items": [{"n": 3}]},
+        ]
+        items = dynamodb._paginate(table, "query", KeyConditionExpression="x")
+        assert items == [{"n": 1}, {"n": 2}, {"n": 3}]
+        assert table.query.call_count == 3
+        assert table.query.call_args_list[2][1]["ExclusiveStartKey"] == {"pk": "b"}
+
+    def test_get_all_orders_returns_every_page(self, ddb_resource):
+        mock_table = MagicMock()
+        mock_table.query.side_effect = [
+            {"Items": [{"order_num": "001"}], "LastEvaluatedKey": {"pk": "run-1:001"}},
+            {"Items": [{"order_num": "002"}]},
+        ]
+        with patch("src.common.dynamodb._get_table", return_value=mock_table):
+            results = dynamodb.get_all_orders("run-1")
+        assert [r["order_num"] for r in results] == ["001", "002"]
+
+
 def _throttle_error(code="ProvisionedThroughputExceededException"):
     """Create a ClientError simulating DynamoDB throttling."""
     return ClientError(
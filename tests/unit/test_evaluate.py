@@ -93,3 +93,15 @@ class TestEvaluateOrders:
         ready, failed, waiting = evaluate_orders(orders)
         assert len(ready) == 0
         assert len(waiting) == 1
+
+    def test_failed_dep_wins_over_running_dep(self):
+        orders = [
+            _order("a", status=RUNNING),
+            _order("b", status=FAILED),
+            _order("c", deps=["a", "b"]),
+            _order("d", deps=["a", "b"], must_succeed=False),
+        ]
+        ready, failed, waiting = evaluate_orders(orders)
+        assert [o["queue_id"] for o in failed] == ["c"]
+        assert [o["queue_id"] for o in waiting] == ["d"]
+        assert ready == []
@@ -2,6 +2,7 @@
 
 import base64
 import json
+from unittest.mock import patch
 
 import boto3
 import pytest
@@ -92,6 +93,30 @@ class TestInsertOrders:
         assert order2 is not None
         assert order2["order_name"] == "order-b"
 
+    def test_more_than_one_batch(self, ddb_resource):
+        job = _make_job(orders=[
+            Order(cmds=["echo"], timeout=300) for _ in range(30)
+        ])
+        repackaged = [
+            {"order_num": f"{i:04d}", "order_name": f"order-{i}", "callback_url": "https://cb"}
+            for i in range(1, 31)
+        ]
+
+        with patch.object(dynamodb, "put_order") as mock_put:
+            insert_orders(
+                job=job,
+                run_id="run-1",
+                flow_id="flow",
+                trace_id="trace",
+                repackaged_orders=repackaged,
+                internal_bucket="bucket",
+                dynamodb_resource=ddb_resource,
+            )
+        mock_put.assert_not_called()
+
+        items = ddb_resource.Table("test-orders").scan()["Items"]
+        assert len(items) == 30
+
     def test_ttl_set(self, ddb_resource):
         job = _make_job(orders=[
             Order(cmds=["echo"], timeout=300),
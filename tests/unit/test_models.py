@@ -369,6 +369,17 @@ class TestOrderRecord:
         record = OrderRecord.from_dict(data)
         assert record.status == RUNNING
 
+    def test_slotted_no_instance_dict(self):
+        record = OrderRecord(
+            run_id="run-1",
+            order_num="001",
+            trace_id="abc",
+            flow_id="user:abc-exec",
+            order_name="deploy",
+            cmds=["cmd1"],
+        )
+        assert not hasattr(record, "__dict__")
+
     def test_execution_target_default(self):
         record = OrderRecord(
             run_id="run-1",
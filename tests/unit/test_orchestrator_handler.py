@@ -0,0 +1,129 @@
+"""Unit tests for src/orchestrator/handler.py."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.common.models import QUEUED, RUNNING, SUCCEEDED
+from src.orchestrator.handler import (
+    _execute_run,
+    _parse_run_id_from_s3_key,
+    execute_orders,
+    handler,
+)
+
+
+class TestParseRunId:
+    @pytest.mark.parametrize("key,expected", [
+        ("tmp/callbacks/runs/run-1/0001/result.json", "run-1"),
+        ("prefix/tmp/callbacks/runs/abc/init", "abc"),
+        ("tmp/callbacks/runs/run-1", ""),
+        ("tmp/callbacks/runs//0001/result.json", ""),
+        ("other/runs/run-1/0001/result.json", ""),
+        ("", ""),
+    ])
+    def test_parse(self, key, expected):
+        assert _parse_run_id_from_s3_key(key) == expected
+
+
+def _s3_record(key):
+    return {"s3": {"object": {"key": key}}}
+
+
+def _sqs_record(*keys):
+    return {"body": json.dumps({"Records": [_s3_record(k) for k in keys]})}
+
+
+class TestHandler:
+    def test_direct_s3_event(self):
+        event = {"Records": [_s3_record("tmp/callbacks/runs/run-1/0000/result.json")]}
+        with patch("src.orchestrator.handler._execute_run",
+                   return_value={"status": "in_progress"}) as run:
+            assert handler(event) == {"status": "in_progress"}
+        run.assert_called_once_with("run-1")
+
+    def test_sqs_batch_runs_each_run_id_once(self):
+        event = {"Records": [
+            _sqs_record("tmp/callbacks/runs/run-1/0001/result.json"),
+            _sqs_record("tmp/callbacks/runs/run-1/0002/result.json",
+                        "tmp/callbacks/runs/run-2/0001/result.json"),
+            {"body": json.dumps({"Event": "s3:TestEvent"})},
+        ]}
+        with patch("src.orchestrator.handler._execute_run",
+                   side_effect=lambda run_id: {"status": "in_progress"}) as run:
+            result = handler(event)
+        assert [c.args[0] for c in run.call_args_list] == ["run-1", "run-2"]
+        assert set(result["runs"]) == {"run-1", "run-2"}
+
+    def test_sqs_reports_skipped_and_failed_runs(self):
+        event = {"Records": [
+            {"messageId": "m1", **_sqs_record("tmp/callbacks/runs/run-1/0001/result.json")},
+            {"messageId": "m2", **_sqs_record("tmp/callbacks/runs/run-2/0001/result.json")},
+            {"messageId": "m3", **_sqs_record("tmp/callbacks/runs/run-3/0001/result.json")},
+            {"messageId": "m4", **_sqs_record("tmp/callbacks/runs/run-1/0002/result.json")},
+        ]}
+        statuses = {"run-1": "skipped", "run-2": "in_progress", "run-3": "error"}
+        with patch("src.orchestrator.handler._execute_run",
+                   side_effect=lambda run_id: {"status": statuses[run_id]}):
+            result = handler(event)
+        assert result["batchItemFailures"] == [
+            {"itemIdentifier": "m1"},
+            {"itemIdentifier": "m3"},
+            {"itemIdentifier": "m4"},
+        ]
+
+    def test_sqs_single_run_success_reports_no_failures(self):
+        event = {"Records": [
+            {"messageId": "m1", **_sqs_record("tmp/callbacks/runs/run-1/0001/result.json")},
+        ]}
+        with patch("src.orchestrator.handler._execute_run",
+                   return_value={"status": "in_progress"}):
+            assert handler(event) == {"status": "in_progress", "batchItemFailures": []}
+
+    def test_no_run_id_is_error(self):
+        event = {"Records": [{"body": "not json"}]}
+        assert handler(event)["message"] == "Missing run_id"
+
+    @patch("src.orchestrator.handler.execute_orders")
+    @patch("src.orchestrator.handler.acquire_lock", return_value=False)
+    def test_locked_run_is_skipped(self, mock_lock, mock_execute):
+        assert _execute_run("run-1")["status"] == "skipped"
+        mock_execute.assert_not_called()
+
+
+@patch("src.orchestrator.handler.check_and_finalize", return_value=False)
+@patch("src.orchestrator.handler.dynamodb.get_all_orders")
+@patch("src.orchestrator.handler.dispatch_orders")
+@patch("src.orchestrator.handler.read_state")
+class TestExecuteOrders:
+    def _orders(self):
+        return [
+            {"order_num": "0001", "queue_id": "a", "status": QUEUED},
+            {"order_num": "0002", "queue_id": "b", "status": SUCCEEDED},
+        ]
+
+    def test_dispatched_statuses_applied_in_memory(
+        self, mock_read, mock_dispatch, mock_get_all, mock_finalize,
+    ):
+        mock_read.return_value = self._orders()
+        mock_dispatch.return_value = [{"order_num": "0001"}]
+
+        result = execute_orders("run-1")
+
+        assert result["dispatched"] == 1
+        mock_get_all.assert_not_called()
+        orders = mock_finalize.call_args.kwargs["orders"]
+        assert [o["status"] for o in orders] == [RUNNING, SUCCEEDED]
+
+    def test_failed_dispatch_rereads_orders(
+        self, mock_read, mock_dispatch, mock_get_all, mock_finalize,
+    ):
+        mock_read.return_value = self._orders()
+        mock_dispatch.return_value = []
+        mock_get_all.return_value = ["reread"]
+
+        execute_orders("run-1")
+
+        mock_get_all.assert_called_once()
+        assert mock_finalize.call_args.kwargs["orders"] == ["reread"]
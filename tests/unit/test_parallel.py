@@ -0,0 +1,40 @@
+"""Unit tests for src/common/parallel.py."""
+
+import pytest
+
+from src.common import parallel
+from src.common.parallel import order_workers, run_parallel
+
+
+class TestRunParallel:
+    def test_runs_every_task(self):
+        seen = {}
+        run_parallel(lambda i, v: seen.__setitem__(i, v), [(i, i * 2) for i in range(20)])
+        assert seen == {i: i * 2 for i in range(20)}
+
+    def test_first_error_raised(self):
+        def task(i):
+            if i == 3:
+                raise RuntimeError("order 3 failed")
+
+        with pytest.raises(RuntimeError, match="order 3 failed"):
+            run_parallel(task, [(i,) for i in range(5)])
+
+    def test_no_tasks(self):
+        run_parallel(lambda: None, [])
+
+
+class TestOrderWorkers:
+    @pytest.mark.parametrize("memory,expected", [
+        ("512", 4),
+        ("128", 1),
+        ("10240", parallel.ORDER_MAX_WORKERS),
+        ("not-a-number", parallel.ORDER_MAX_WORKERS),
+    ])
+    def test_sized_from_lambda_memory(self, monkeypatch, memory, expected):
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", memory)
+        assert order_workers() == expected
+
+    def test_cap_outside_lambda(self, monkeypatch):
+        monkeypatch.delenv("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", raising=False)
+        assert order_workers() == parallel.ORDER_MAX_WORKERS
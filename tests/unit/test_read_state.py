@@ -166,6 +166,34 @@ class TestReadState:
         assert len(events) == 1
         assert events[0]["event_type"] == "completed"
 
+    def test_multiple_running_orders_only_completed_updated(self, aws_resources):
+        ddb = aws_resources["ddb"]
+        s3 = aws_resources["s3"]
+
+        for num in ("0001", "0002", "0003"):
+            dynamodb.put_order("run-1", num, {
+                "order_name": f"order-{num}",
+                "status": RUNNING,
+                "trace_id": "abc",
+                "order_num": num,
+            }, dynamodb_resource=ddb)
+
+        s3.put_object(
+            Bucket="test-internal",
+            Key="tmp/callbacks/runs/run-1/0002/result.json",
+            Body=json.dumps({"status": "failed", "log": "boom"}).encode(),
+        )
+
+        orders = read_state(
+            "run-1", trace_id="abc",
+            internal_bucket="test-internal",
+            dynamodb_resource=ddb,
+            s3_client=s3,
+        )
+
+        statuses = {o["order_num"]: o["status"] for o in orders}
+        assert statuses == {"0001": RUNNING, "0002": "failed", "0003": RUNNING}
+
     def test_ignores_queued_orders(self, aws_resources):
         """Queued orders should not have S3 checked."""
         ddb = aws_resources["ddb"]
@@ -1,19 +1,32 @@
 """Unit tests for src/init_job/repackage.py."""
 
+import io
 import os
 import shutil
+import subprocess
 import tempfile
+import threading
+import zipfile
 from unittest.mock import patch, MagicMock
 
+import boto3
 import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
 
 from src.common.models import Job, Order
 from src.init_job.repackage import repackage_orders
+from src.common import code_source
 from src.common.code_source import (
+    detach_file,
     extract_folder,
     group_git_orders,
     fetch_ssm_values,
     fetch_secret_values,
+    fetch_all_credentials,
+    clear_credential_cache,
+    extract_zip,
+    fetch_code_s3,
     zip_directory,
 )
 
@@ -37,6 +50,160 @@ def _make_order(**kwargs):
     return Order(**defaults)
 
 
+@pytest.fixture
+def aws_env(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+
+
+@pytest.fixture(autouse=True)
+def _clear_credential_cache():
+    clear_credential_cache()
+    yield
+    clear_credential_cache()
+
+
+class TestFetchSsmValues:
+    def test_batches_more_than_ten_paths(self, aws_env):
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            paths = [f"/app/param-{i}" for i in range(12)]
+            for i, path in enumerate(paths):
+                ssm.put_parameter(Name=path, Value=f"v{i}", Type="SecureString")
+
+            result = fetch_ssm_values(paths)
+
+            assert len(result) == 12
+            assert result["PARAM_0"] == "v0"
+            assert result["PARAM_11"] == "v11"
+
+    def test_missing_parameter_raises(self, aws_env):
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(Name="/app/exists", Value="v", Type="String")
+
+            with pytest.raises(ClientError, match="/app/missing"):
+                fetch_ssm_values(["/app/exists", "/app/missing"])
+
+    def test_empty_paths(self):
+        assert fetch_ssm_values([]) == {}
+
+    @pytest.mark.parametrize("path,expected", [
+        ("/app/db-password", "DB_PASSWORD"),
+        ("no_slash", "NO_SLASH"),
+        ("/app/Mixed-Case_9", "MIXED_CASE_9"),
+    ])
+    def test_env_key(self, path, expected):
+        assert code_source._env_key(path) == expected
+
+    def test_repeat_fetch_served_from_cache(self, aws_env):
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(Name="/app/token", Value="v1", Type="SecureString")
+            assert fetch_ssm_values(["/app/token"]) == {"TOKEN": "v1"}
+
+            ssm.put_parameter(Name="/app/token", Value="v2", Type="SecureString", Overwrite=True)
+            assert fetch_ssm_values(["/app/token"]) == {"TOKEN": "v1"}
+
+            clear_credential_cache()
+            assert fetch_ssm_values(["/app/token"]) == {"TOKEN": "v2"}
+
+    def test_cache_disabled_with_zero_ttl(self, aws_env, monkeypatch):
+        monkeypatch.setenv("AWS_EXE_SYS_SSM_CACHE_TTL", "0")
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(Name="/app/token", Value="v1", Type="SecureString")
+            fetch_ssm_values(["/app/token"])
+            ssm.put_parameter(Name="/app/token", Value="v2", Type="SecureString", Overwrite=True)
+            assert fetch_ssm_values(["/app/token"]) == {"TOKEN": "v2"}
+
+    def test_not_found_is_not_cached(self, aws_env):
+        with mock_aws():
+            with pytest.raises(ClientError):
+                fetch_ssm_values(["/app/late"])
+
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(Name="/app/late", Value="v", Type="String")
+            assert fetch_ssm_values(["/app/late"]) == {"LATE": "v"}
+
+    @pytest.mark.parametrize("raw,expected", [
+        (None, code_source.DEFAULT_CACHE_TTL),
+        ("0", 0),
+        ("120", 120),
+        ("ten", code_source.DEFAULT_CACHE_TTL),
+    ])
+    def test_cache_ttl_from_env(self, monkeypatch, raw, expected):
+        if raw is None:
+            monkeypatch.delenv("AWS_EXE_SYS_SSM_CACHE_TTL", raising=False)
+        else:
+            monkeypatch.setenv("AWS_EXE_SYS_SSM_CACHE_TTL", raw)
+        assert code_source._cache_ttl() == expected
+
+
+class TestFetchSecretValues:
+    def test_fetches_batch(self, aws_env):
+        with mock_aws():
+            sm = boto3.client("secretsmanager", region_name="us-east-1")
+            sm.create_secret(Name="prod/db-pass", SecretString="s1")
+            sm.create_secret(Name="prod/api-key", SecretString="s2")
+
+            result = fetch_secret_values(["prod/db-pass", "prod/api-key"])
+
+            assert result == {"DB_PASS": "s1", "API_KEY": "s2"}
+
+    def test_missing_secret_raises(self, aws_env):
+        with mock_aws():
+            with pytest.raises(ClientError):
+                fetch_secret_values(["prod/missing"])
+
+
+class TestFetchAllCredentials:
+    def test_fetches_both_kinds(self, aws_env):
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(Name="/app/db-host", Value="db.local", Type="String")
+            sm = boto3.client("secretsmanager", region_name="us-east-1")
+            sm.create_secret(Name="prod/db-pass", SecretString="s1")
+
+            ssm_values, secret_values = fetch_all_credentials(
+                ["/app/db-host"], ["prod/db-pass"],
+            )
+
+            assert ssm_values == {"DB_HOST": "db.local"}
+            assert secret_values == {"DB_PASS": "s1"}
+
+    def test_empty_paths(self):
+        assert fetch_all_credentials([], []) == ({}, {})
+
+
+class TestSshKey:
+    def test_key_round_trip_and_release(self):
+        key_path = code_source._write_ssh_key("-----BEGIN KEY-----\n")
+        try:
+            assert oct(os.stat(key_path).st_mode & 0o777) == "0o600"
+            # A child process (ssh) can read it by path
+            out = subprocess.run(["cat", key_path], capture_output=True, text=True)
+            assert out.stdout == "-----BEGIN KEY-----\n"
+        finally:
+            code_source.release_ssh_key(key_path)
+        assert not os.path.exists(key_path)
+
+    @patch("src.common.code_source.fetch_ssm_values", return_value={"KEY": "k"})
+    def test_resolve_git_credentials_ssh_key(self, mock_fetch):
+        token, key_path = code_source.resolve_git_credentials(ssh_key_location="/ssh")
+        try:
+            with open(key_path) as f:
+                assert f.read() == "k"
+        finally:
+            code_source.release_ssh_key(key_path)
+
+    def test_release_none_is_noop(self):
+        code_source.release_ssh_key(None)
+
+
 class TestZipDirectory:
     def test_creates_zip(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -52,6 +219,209 @@ class TestZipDirectory:
             assert os.path.exists(zip_path)
             assert os.path.getsize(zip_path) > 0
 
+    def test_round_trip(self, tmp_path, monkeypatch):
+        # Force the 'large' file down the ZipFile.write path
+        monkeypatch.setattr("src.common.code_source.ZIP_PARALLEL_MAX_FILE", 1024)
+        src = tmp_path / "src"
+        (src / "sub").mkdir(parents=True)
+        (src / "a.txt").write_text("hello " * 10)
+        (src / "sub" / "b.tf").write_text("resource {}")
+        (src / "sub" / "big.bin").write_bytes(os.urandom(4096))
+        (src / "empty").write_bytes(b"")
+        (src / ".git").mkdir()
+        (src / ".git" / "HEAD").write_text("ref: refs/heads/main")
+
+        zip_path = str(tmp_path / "out.zip")
+        zip_directory(str(src), zip_path)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+            assert sorted(zf.namelist()) == ["a.txt", "empty", "sub/b.tf", "sub/big.bin"]
+            assert zf.read("sub/b.tf") == b"resource {}"
+            assert zf.read("sub/big.bin") == (src / "sub" / "big.bin").read_bytes()
+            assert zf.getinfo("a.txt").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_precompressed_files_stored(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "logo.PNG").write_bytes(os.urandom(512))
+        (src / "main.tf").write_text("resource {}")
+
+        zip_path = str(tmp_path / "out.zip")
+        zip_directory(str(src), zip_path)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.getinfo("logo.PNG").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("main.tf").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read("logo.PNG") == (src / "logo.PNG").read_bytes()
+
+    def test_zipfile_internals_present(self, tmp_path):
+        # Fails loudly if a Python upgrade drops what _write_deflated uses
+        with zipfile.ZipFile(str(tmp_path / "out.zip"), "w") as zf:
+            assert code_source._can_append_raw(zf)
+
+    def test_serial_fallback_without_internals(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "src.common.code_source._ZIPFILE_INTERNALS", ("fp", "_not_there"),
+        )
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.txt").write_text("hello " * 10)
+        (src / "logo.png").write_bytes(os.urandom(64))
+
+        zip_path = str(tmp_path / "out.zip")
+        with patch("src.common.code_source._write_deflated") as raw:
+            zip_directory(str(src), zip_path)
+        raw.assert_not_called()
+
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+            assert zf.read("a.txt") == b"hello " * 10
+            assert zf.getinfo("logo.png").compress_type == zipfile.ZIP_STORED
+
+    def test_in_flight_payloads_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.common.code_source.ZIP_MAX_IN_FLIGHT", 2)
+        src = tmp_path / "src"
+        src.mkdir()
+        for i in range(20):
+            (src / f"f{i:02}.txt").write_text(f"file {i} " * 50)
+
+        lock = threading.Lock()
+        state = {"unwritten": 0, "peak": 0}
+        deflate = code_source._deflate_file
+        write = code_source._write_deflated
+
+        def counting_deflate(*args):
+            result = deflate(*args)
+            with lock:
+                state["unwritten"] += 1
+                state["peak"] = max(state["peak"], state["unwritten"])
+            return result
+
+        def counting_write(*args):
+            with lock:
+                state["unwritten"] -= 1
+            write(*args)
+
+        monkeypatch.setattr("src.common.code_source._deflate_file", counting_deflate)
+        monkeypatch.setattr("src.common.code_source._write_deflated", counting_write)
+        zip_path = str(tmp_path / "out.zip")
+        zip_directory(str(src), zip_path)
+
+        assert state["peak"] <= 2
+        with zipfile.ZipFile(zip_path) as zf:
+            assert zf.testzip() is None
+            assert len(zf.namelist()) == 20
+
+    def test_zip_info_matches_from_file(self, tmp_path):
+        path = tmp_path / "run.sh"
+        path.write_text("echo hi")
+        path.chmod(0o755)
+
+        zinfo = code_source._zip_info("run.sh", os.stat(path))
+        expected = zipfile.ZipInfo.from_file(str(path), "run.sh")
+
+        assert zinfo.date_time == expected.date_time
+        assert zinfo.external_attr == expected.external_attr
+        assert zinfo.file_size == expected.file_size
+
+
+class TestExtractZip:
+    def test_round_trips_nested_tree(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = os.path.join(tmpdir, "src")
+            os.makedirs(os.path.join(src, "a", "b"))
+            os.makedirs(os.path.join(src, "empty"))
+            for i in range(20):
+                with open(os.path.join(src, "a", "b", f"f{i}.txt"), "w") as f:
+                    f.write(f"content {i}")
+            with open(os.path.join(src, "top.txt"), "w") as f:
+                f.write("top")
+
+            zip_path = os.path.join(tmpdir, "code.zip")
+            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                for root, dirs, files in os.walk(src):
+                    for d in dirs:
+                        full = os.path.join(root, d)
+                        zf.write(full, os.path.relpath(full, src))
+                    for name in files:
+                        full = os.path.join(root, name)
+                        zf.write(full, os.path.relpath(full, src))
+
+            dest = os.path.join(tmpdir, "dest")
+            os.makedirs(dest)
+            extract_zip(zip_path, dest)
+
+            with open(os.path.join(dest, "a", "b", "f7.txt")) as f:
+                assert f.read() == "content 7"
+            with open(os.path.join(dest, "top.txt")) as f:
+                assert f.read() == "top"
+            assert os.path.isdir(os.path.join(dest, "empty"))
+
+    def test_strips_parent_references(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zip_path = os.path.join(tmpdir, "evil.zip")
+            with zipfile.ZipFile(zip_path, "w") as zf:
+                zf.writestr("../escape.txt", "nope")
+
+            dest = os.path.join(tmpdir, "dest")
+            os.makedirs(dest)
+            extract_zip(zip_path, dest)
+
+            assert os.path.exists(os.path.join(dest, "escape.txt"))
+            assert not os.path.exists(os.path.join(tmpdir, "escape.txt"))
+
+    def test_extracts_from_memoryview(self, tmp_path):
+        data = bytearray(_zip_bytes({"a.txt": "alpha", "sub/b.txt": "beta"}))
+        with memoryview(data) as view:
+            extract_zip(view, str(tmp_path))
+            # Every reader released its view, so this one can be released too
+        assert (tmp_path / "sub" / "b.txt").read_text() == "beta"
+        data.append(0)  # resizable again once no exports remain
+
+
+def _zip_bytes(files):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+class TestFetchCodeS3:
+    def test_extracts_in_memory(self, aws_env):
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="src")
+            s3.put_object(
+                Bucket="src", Key="code.zip",
+                Body=_zip_bytes({"main.sh": "echo hi", "lib/util.sh": "true"}),
+            )
+
+            work_dir = fetch_code_s3("s3://src/code.zip")
+            try:
+                assert sorted(os.listdir(work_dir)) == ["lib", "main.sh"]
+                with open(os.path.join(work_dir, "lib", "util.sh")) as f:
+                    assert f.read() == "true"
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    def test_extracts_rolled_over_spool(self, aws_env, monkeypatch):
+        monkeypatch.setattr("src.common.code_source.SPOOL_MAX_SIZE", 16)
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="src")
+            s3.put_object(
+                Bucket="src", Key="code.zip",
+                Body=_zip_bytes({"main.sh": "echo hi" * 100}),
+            )
+
+            work_dir = fetch_code_s3("s3://src/code.zip")
+            try:
+                assert os.listdir(work_dir) == ["main.sh"]
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
 
 class TestExtractFolder:
     def test_copies_entire_clone(self):
@@ -97,12 +467,171 @@ class TestExtractFolder:
             finally:
                 shutil.rmtree(result, ignore_errors=True)
 
+    def test_files_are_hard_linked(self, tmp_path):
+        clone_dir = tmp_path / "clone"
+        clone_dir.mkdir()
+        (clone_dir / "main.tf").write_text("resource {}")
+
+        result = extract_folder(str(clone_dir))
+        try:
+            linked = os.path.join(result, "main.tf")
+            assert os.path.samefile(linked, clone_dir / "main.tf")
+
+            # Writers detach first, leaving the clone untouched
+            detach_file(linked)
+            with open(linked, "w") as f:
+                f.write("changed")
+            assert (clone_dir / "main.tf").read_text() == "resource {}"
+        finally:
+            shutil.rmtree(result, ignore_errors=True)
+
+    @patch("src.common.code_source.os.link", side_effect=OSError("EXDEV"))
+    def test_falls_back_to_copy(self, mock_link, tmp_path):
+        (tmp_path / "main.tf").write_text("resource {}")
+        result = extract_folder(str(tmp_path))
+        try:
+            with open(os.path.join(result, "main.tf")) as f:
+                assert f.read() == "resource {}"
+        finally:
+            shutil.rmtree(result, ignore_errors=True)
+
     def test_missing_folder_raises(self):
         with tempfile.TemporaryDirectory() as clone_dir:
             with pytest.raises(FileNotFoundError, match="nonexistent"):
                 extract_folder(clone_dir, "nonexistent")
 
 
+def _git(*args, cwd=None):
+    return subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args],
+        check=True, capture_output=True, text=True, cwd=cwd,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def origin_repo(tmp_path, monkeypatch):
+    """A local repo standing in for GitHub, plus an isolated mirror cache."""
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git("init", "-q", "-b", "main", cwd=origin)
+    (origin / "app").mkdir()
+    (origin / "app" / "main.tf").write_text("v1")
+    _git("add", ".", cwd=origin)
+    _git("commit", "-qm", "v1", cwd=origin)
+    monkeypatch.setattr(code_source, "GIT_CACHE_DIR", str(tmp_path / "cache"))
+    return origin
+
+
+class TestGitMirror:
+    def test_worktree_from_mirror(self, origin_repo, tmp_path):
+        url = f"file://{origin_repo}"
+        mirror = code_source._ensure_mirror("org/repo", url)
+        work_dir = str(tmp_path / "wt")
+        _git("worktree", "add", "--detach", work_dir, "HEAD", cwd=mirror)
+        with open(os.path.join(work_dir, "app", "main.tf")) as f:
+            assert f.read() == "v1"
+
+    def test_refresh_fetches_new_commit(self, origin_repo):
+        url = f"file://{origin_repo}"
+        mirror = code_source._ensure_mirror("org/repo", url)
+        (origin_repo / "app" / "main.tf").write_text("v2")
+        _git("commit", "-qam", "v2", cwd=origin_repo)
+        sha = _git("rev-parse", "HEAD", cwd=origin_repo)
+
+        assert code_source._ensure_mirror("org/repo", url) == mirror
+        assert _git("rev-parse", "main", cwd=mirror) == sha
+
+    def test_warm_mirror_skips_set_url(self, origin_repo):
+        url = f"file://{origin_repo}"
+        code_source._ensure_mirror("org/repo", url)
+        with patch("src.common.code_source._git", wraps=code_source._git) as git:
+            code_source._ensure_mirror("org/repo", url)
+        commands = [c.args[0][:2] for c in git.call_args_list]
+        assert ["remote", "set-url"] not in commands
+
+    def test_sparse_worktree_only_checks_out_folders(self, origin_repo):
+        (origin_repo / "other").mkdir()
+        (origin_repo / "other" / "big.bin").write_text("x" * 1024)
+        _git("add", ".", cwd=origin_repo)
+        _git("commit", "-qm", "other", cwd=origin_repo)
+
+        real_ensure = code_source._ensure_mirror
+        with patch(
+            "src.common.code_source._ensure_mirror",
+            side_effect=lambda repo, url, *a: real_ensure(repo, f"file://{origin_repo}", *a),
+        ):
+            work_dir = code_source._clone_from_mirror("org/repo", folders=["app"])
+        try:
+            assert os.path.isfile(os.path.join(work_dir, "app", "main.tf"))
+            assert not os.path.exists(os.path.join(work_dir, "other"))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def test_mirror_failure_returns_none(self, origin_repo):
+        err = subprocess.CalledProcessError(128, ["git"], stderr="denied")
+        with patch("src.common.code_source._ensure_mirror", side_effect=err):
+            assert code_source._clone_from_mirror("org/repo", token="t") is None
+
+
+class TestShallowClone:
+    def test_pinned_commit_fetches_only_that_commit(self, origin_repo, tmp_path):
+        first = _git("rev-parse", "HEAD", cwd=origin_repo)
+        (origin_repo / "app" / "main.tf").write_text("v2")
+        _git("commit", "-qam", "v2", cwd=origin_repo)
+
+        work_dir = str(tmp_path / "wt")
+        code_source._shallow_clone(f"file://{origin_repo}", work_dir, first)
+        code_source._git(["checkout", "-q", "FETCH_HEAD"], cwd=work_dir)
+
+        assert _git("rev-parse", "HEAD", cwd=work_dir) == first
+        assert _git("rev-list", "--count", "HEAD", cwd=work_dir) == "1"
+        with open(os.path.join(work_dir, "app", "main.tf")) as f:
+            assert f.read() == "v1"
+
+    def test_no_commit_clones_default_branch(self, origin_repo, tmp_path):
+        work_dir = str(tmp_path / "wt")
+        code_source._shallow_clone(f"file://{origin_repo}", work_dir,
+                                   filter_blobs=False)
+        with open(os.path.join(work_dir, "app", "main.tf")) as f:
+            assert f.read() == "v1"
+
+
+class TestCloneAll:
+    @patch("src.common.code_source.clone_repo")
+    def test_clones_each_group(self, mock_clone):
+        mock_clone.side_effect = lambda repo, commit_hash=None, **kw: f"/tmp/{repo}-{commit_hash}"
+        groups = {
+            ("org/a", None): [(0, _make_order(git_folder="x"))],
+            ("org/b", "abc"): [(1, _make_order()), (2, _make_order(git_folder="y"))],
+        }
+        result = code_source.clone_all(groups, token="t")
+        assert result == {
+            ("org/a", None): "/tmp/org/a-None",
+            ("org/b", "abc"): "/tmp/org/b-abc",
+        }
+        folders = {c.kwargs["repo"]: c.kwargs["folders"] for c in mock_clone.call_args_list}
+        assert folders == {"org/a": ["x"], "org/b": None}
+
+    @patch("src.common.code_source.clone_repo")
+    def test_failure_removes_finished_clones(self, mock_clone, tmp_path):
+        ok_dir = tmp_path / "ok"
+        ok_dir.mkdir()
+
+        def clone(repo, **kw):
+            if repo == "org/bad":
+                raise subprocess.CalledProcessError(128, ["git"])
+            return str(ok_dir)
+
+        mock_clone.side_effect = clone
+        groups = {
+            ("org/ok", None): [(0, _make_order())],
+            ("org/bad", None): [(1, _make_order())],
+        }
+        with pytest.raises(subprocess.CalledProcessError):
+            code_source.clone_all(groups, max_workers=1)
+        assert not ok_dir.exists()
+
+
 class TestGroupGitOrders:
     def test_groups_same_repo(self):
         job = _make_job(orders=[
@@ -156,22 +685,20 @@ class TestGroupGitOrders:
 
 class TestRepackageOrders:
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run-1/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
-    @patch("src.init_job.repackage.clone_repo")
-    @patch("src.init_job.repackage.fetch_ssm_values")
-    @patch("src.init_job.repackage.fetch_secret_values")
+    @patch("src.common.code_source.clone_repo")
+    @patch("src.init_job.repackage.fetch_all_credentials")
     @patch("src.init_job.repackage.s3_ops.generate_callback_presigned_url")
     @patch("src.init_job.repackage.OrderBundler")
     def test_repackage_produces_correct_structure(
-        self, MockBundler, mock_presign, mock_secrets,
-        mock_ssm, mock_clone, mock_resolve_creds,
+        self, MockBundler, mock_presign, mock_creds,
+        mock_clone, mock_resolve_creds,
         mock_gen_key, mock_store_ssm,
     ):
         with tempfile.TemporaryDirectory() as clone_dir:
             mock_clone.return_value = clone_dir
-            mock_ssm.return_value = {"DB_PASS": "secret"}
-            mock_secrets.return_value = {}
+            mock_creds.return_value = ({"DB_PASS": "secret"}, {})
             mock_presign.return_value = "https://presigned.url"
 
             bundler_instance = MagicMock()
@@ -210,22 +737,20 @@ class TestRepackageOrders:
             assert call_kwargs["ssm_values"] == {"DB_PASS": "secret"}
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run-1/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
     @patch("src.init_job.repackage.fetch_code_s3")
-    @patch("src.init_job.repackage.fetch_ssm_values")
-    @patch("src.init_job.repackage.fetch_secret_values")
+    @patch("src.init_job.repackage.fetch_all_credentials")
     @patch("src.init_job.repackage.s3_ops.generate_callback_presigned_url")
     @patch("src.init_job.repackage.OrderBundler")
     def test_s3_code_source(
-        self, MockBundler, mock_presign, mock_secrets,
-        mock_ssm, mock_s3, mock_resolve_creds,
+        self, MockBundler, mock_presign, mock_creds,
+        mock_s3, mock_resolve_creds,
         mock_gen_key, mock_store_ssm,
     ):
         with tempfile.TemporaryDirectory() as code_dir:
             mock_s3.return_value = code_dir
-            mock_ssm.return_value = {}
-            mock_secrets.return_value = {}
+            mock_creds.return_value = ({}, {})
             mock_presign.return_value = "https://presigned.url"
             MockBundler.return_value = MagicMock()
 
@@ -248,22 +773,20 @@ class TestRepackageOrders:
             mock_s3.assert_called_once_with("s3://bucket/code.zip")
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run-1/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
-    @patch("src.init_job.repackage.clone_repo")
-    @patch("src.init_job.repackage.fetch_ssm_values")
-    @patch("src.init_job.repackage.fetch_secret_values")
+    @patch("src.common.code_source.clone_repo")
+    @patch("src.init_job.repackage.fetch_all_credentials")
     @patch("src.init_job.repackage.s3_ops.generate_callback_presigned_url")
     @patch("src.init_job.repackage.OrderBundler")
     def test_multiple_orders_same_repo_clones_once(
-        self, MockBundler, mock_presign, mock_secrets,
-        mock_ssm, mock_clone, mock_resolve_creds,
+        self, MockBundler, mock_presign, mock_creds,
+        mock_clone, mock_resolve_creds,
         mock_gen_key, mock_store_ssm,
     ):
         with tempfile.TemporaryDirectory() as clone_dir:
             mock_clone.return_value = clone_dir
-            mock_ssm.return_value = {}
-            mock_secrets.return_value = {}
+            mock_creds.return_value = ({}, {})
             mock_presign.return_value = "https://presigned.url"
             MockBundler.return_value = MagicMock()
 
@@ -296,21 +819,20 @@ class TestRepackageOrders:
             mock_clone.assert_called_once()
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run-1/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
-    @patch("src.init_job.repackage.clone_repo")
-    @patch("src.init_job.repackage.fetch_ssm_values")
-    @patch("src.init_job.repackage.fetch_secret_values")
+    @patch("src.common.code_source.clone_repo")
+    @patch("src.init_job.repackage.fetch_all_credentials")
     @patch("src.init_job.repackage.s3_ops.generate_callback_presigned_url")
     @patch("src.init_job.repackage.OrderBundler")
     def test_different_repos_clone_separately(
-        self, MockBundler, mock_presign, mock_secrets,
-        mock_ssm, mock_clone, mock_resolve_creds,
+        self, MockBundler, mock_presign, mock_creds,
+        mock_clone, mock_resolve_creds,
         mock_gen_key, mock_store_ssm,
     ):
         created_dirs = []
 
-        def clone_side_effect(repo, token=None, commit_hash=None, ssh_key_path=None):
+        def clone_side_effect(repo, token=None, commit_hash=None, ssh_key_path=None, folders=None):
             d = tempfile.mkdtemp(prefix="aws-exe-sys-test-")
             with open(os.path.join(d, "main.tf"), "w") as f:
                 f.write(f"repo={repo}")
@@ -318,8 +840,7 @@ class TestRepackageOrders:
             return d
 
         mock_clone.side_effect = clone_side_effect
-        mock_ssm.return_value = {}
-        mock_secrets.return_value = {}
+        mock_creds.return_value = ({}, {})
         mock_presign.return_value = "https://presigned.url"
         MockBundler.return_value = MagicMock()
 
@@ -344,21 +865,20 @@ class TestRepackageOrders:
             shutil.rmtree(d, ignore_errors=True)
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run-1/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
-    @patch("src.init_job.repackage.clone_repo")
-    @patch("src.init_job.repackage.fetch_ssm_values")
-    @patch("src.init_job.repackage.fetch_secret_values")
+    @patch("src.common.code_source.clone_repo")
+    @patch("src.init_job.repackage.fetch_all_credentials")
     @patch("src.init_job.repackage.s3_ops.generate_callback_presigned_url")
     @patch("src.init_job.repackage.OrderBundler")
     def test_same_repo_different_commits_clone_separately(
-        self, MockBundler, mock_presign, mock_secrets,
-        mock_ssm, mock_clone, mock_resolve_creds,
+        self, MockBundler, mock_presign, mock_creds,
+        mock_clone, mock_resolve_creds,
         mock_gen_key, mock_store_ssm,
     ):
         created_dirs = []
 
-        def clone_side_effect(repo, token=None, commit_hash=None, ssh_key_path=None):
+        def clone_side_effect(repo, token=None, commit_hash=None, ssh_key_path=None, folders=None):
             d = tempfile.mkdtemp(prefix="aws-exe-sys-test-")
             with open(os.path.join(d, "main.tf"), "w") as f:
                 f.write(f"commit={commit_hash}")
@@ -366,8 +886,7 @@ class TestRepackageOrders:
             return d
 
         mock_clone.side_effect = clone_side_effect
-        mock_ssm.return_value = {}
-        mock_secrets.return_value = {}
+        mock_creds.return_value = ({}, {})
         mock_presign.return_value = "https://presigned.url"
         MockBundler.return_value = MagicMock()
 
@@ -392,22 +911,20 @@ class TestRepackageOrders:
             shutil.rmtree(d, ignore_errors=True)
 
     @patch("src.init_job.repackage.store_sops_key_ssm", return_value="/aws-exe-sys/sops-keys/run-1/0001")
-    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT", "/tmp/mock.key"))
+    @patch("src.init_job.repackage._generate_age_key", return_value=("age1pubkey", "AGE-SECRET-KEY-CONTENT"))
     @patch("src.init_job.repackage.resolve_git_credentials", return_value=("mock-token", None))
-    @patch("src.init_job.repackage.clone_repo")
-    @patch("src.init_job.repackage.fetch_ssm_values")
-    @patch("src.init_job.repackage.fetch_secret_values")
+    @patch("src.common.code_source.clone_repo")
+    @patch("src.init_job.repackage.fetch_all_credentials")
     @patch("src.init_job.repackage.s3_ops.generate_callback_presigned_url")
     @patch("src.init_job.repackage.OrderBundler")
     def test_job_level_commit_hash_groups_orders(
-        self, MockBundler, mock_presign, mock_secrets,
-        mock_ssm, mock_clone, mock_resolve_creds,
+        self, MockBundler, mock_presign, mock_creds,
+        mock_clone, mock_resolve_creds,
         mock_gen_key, mock_store_ssm,
     ):
         with tempfile.TemporaryDirectory() as clone_dir:
             mock_clone.return_value = clone_dir
-            mock_ssm.return_value = {}
-            mock_secrets.return_value = {}
+            mock_creds.return_value = ({}, {})
             mock_presign.return_value = "https://presigned.url"
             MockBundler.return_value = MagicMock()
 
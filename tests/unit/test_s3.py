@@ -51,6 +51,15 @@ class TestUploadExecZip:
             os.unlink(temp_path)
 
 
+    def test_upload_uses_transfer_config(self):
+        client = MagicMock()
+        s3.upload_exec_zip("b", "run-1", "001", "/tmp/exec.zip", s3_client=client)
+        client.upload_file.assert_called_once_with(
+            "/tmp/exec.zip", "b", "tmp/exec/run-1/001/exec.zip",
+            Config=s3.EXEC_UPLOAD_CONFIG,
+        )
+
+
 class TestPresignedUrl:
     def test_generate_callback_presigned_url(self, s3_client):
         url = s3.generate_callback_presigned_url(
@@ -103,6 +112,8 @@ class TestWriteResult:
         body = json.loads(obj["Body"].read().decode())
         assert body["status"] == "succeeded"
         assert body["log"] == "all good"
+        assert obj["ContentType"] == "application/json"
+        assert obj["CacheControl"] == "no-cache"
 
 
 class TestWriteInitTrigger:
@@ -148,3 +159,51 @@ class TestCheckResultExists:
             "test-internal", "run-1", "999",
             s3_client=s3_client,
         ) is False
+
+
+class TestBatchResults:
+    def _put_result(self, s3_client, num, status="succeeded"):
+        s3_client.put_object(
+            Bucket="test-internal",
+            Key=f"tmp/callbacks/runs/run-1/{num}/result.json",
+            Body=json.dumps({"status": status, "log": ""}).encode(),
+        )
+
+    def test_read_results_batch(self, s3_client):
+        self._put_result(s3_client, "0001")
+        self._put_result(s3_client, "0003", "failed")
+        results = s3.read_results_batch(
+            "test-internal", "run-1", ["0001", "0002", "0003"],
+            s3_client=s3_client,
+        )
+        assert results == {
+            "0001": {"status": "succeeded", "log": ""},
+            "0003": {"status": "failed", "log": ""},
+        }
+
+    def test_read_results_batch_empty(self, s3_client):
+        assert s3.read_results_batch("test-internal", "run-1", [], s3_client=s3_client) == {}
+
+    def test_check_results_exist_batch(self, s3_client):
+        self._put_result(s3_client, "0001")
+        self._put_result(s3_client, "0002")
+        s3_client.put_object(
+            Bucket="test-internal",
+            Key="tmp/callbacks/runs/run-10/0003/result.json",
+            Body=b"{}",
+        )
+        found = s3.check_results_exist_batch(
+            "test-internal", "run-1", ["0001", "0003", "0004"],
+            s3_client=s3_client,
+        )
+        assert found == {"0001"}
+
+    def test_list_completed_orders(self, s3_client):
+        self._put_result(s3_client, "0000")
+        self._put_result(s3_client, "0002")
+        s3_client.put_object(
+            Bucket="test-internal", Key="tmp/callbacks/runs/run-1/0003/other.json", Body=b"{}",
+        )
+        assert s3.list_completed_orders(
+            "test-internal", "run-1", s3_client=s3_client,
+        ) == {"0000", "0002"}
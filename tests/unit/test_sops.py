@@ -26,15 +26,62 @@ class TestEncryptEnv:
         assert "--encrypt" in call_args
         assert "--age" in call_args
 
+    @patch("src.common.sops._run_cmd")
+    def test_plaintext_passed_on_stdin(self, mock_run_cmd):
+        mock_run_cmd.return_value = ""
+
+        sops.encrypt_env({"KEY1": "val1"}, sops_key="age1abc123")
+
+        assert mock_run_cmd.call_args[0][0][-1] == "/dev/stdin"
+        assert json.loads(mock_run_cmd.call_args[1]["input"]) == {"KEY1": "val1"}
+
     @patch("src.common.sops._generate_age_key")
     @patch("src.common.sops._run_cmd")
     def test_encrypt_auto_gen_key(self, mock_run_cmd, mock_gen_key):
-        mock_gen_key.return_value = ("age1publickey", "AGE-SECRET-KEY-CONTENT", "/tmp/test.key")
+        mock_gen_key.return_value = ("age1publickey", "AGE-SECRET-KEY-CONTENT")
         mock_run_cmd.return_value = ""
 
         encrypted_path, key_used = sops.encrypt_env({"KEY": "val"})
         assert key_used == "age1publickey"
         mock_gen_key.assert_called_once()
+        # Only the public recipient reaches sops
+        assert "env" not in mock_run_cmd.call_args[1]
+        assert "age1publickey" in mock_run_cmd.call_args[0][0]
+
+
+class TestGenerateAgeKey:
+    @patch("src.common.sops._run_cmd")
+    def test_in_process_keygen(self, mock_run_cmd):
+        identity = MagicMock()
+        identity.__str__.return_value = "AGE-SECRET-KEY-1TEST"
+        identity.to_public.return_value.__str__.return_value = "age1testpub"
+        age = MagicMock()
+        age.Identity.generate.return_value = identity
+
+        with patch("src.common.sops.age_x25519", age), \
+                patch("tempfile.mkstemp") as mock_mkstemp:
+            public_key, content = sops._generate_age_key()
+
+        assert public_key == "age1testpub"
+        assert content.endswith("# public key: age1testpub\nAGE-SECRET-KEY-1TEST\n")
+        mock_mkstemp.assert_not_called()
+        mock_run_cmd.assert_not_called()
+
+    @patch("src.common.sops._run_cmd")
+    def test_age_keygen_fallback_reads_stdout(self, mock_run_cmd):
+        mock_run_cmd.return_value = (
+            "# created: 2024-01-01T00:00:00Z\n"
+            "# public key: age1fallback\n"
+            "AGE-SECRET-KEY-1FALLBACK\n"
+        )
+
+        with patch("src.common.sops.age_x25519", None):
+            public_key, content = sops._generate_age_key()
+
+        assert public_key == "age1fallback"
+        assert content == mock_run_cmd.return_value
+        # No -o: the key is never written to a file
+        assert mock_run_cmd.call_args[0][0] == ["age-keygen"]
 
 
 class TestDecryptEnv:
@@ -113,6 +160,9 @@ class TestRunCmd:
         result = sops._run_cmd(["echo", "hello"])
         assert result == "output"
 
+    def test_input_fed_to_stdin(self):
+        assert sops._run_cmd(["cat"], input="piped") == "piped"
+
     @patch("subprocess.run")
     def test_failure_raises(self, mock_subprocess):
         mock_subprocess.return_value = MagicMock(
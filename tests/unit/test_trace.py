@@ -2,6 +2,8 @@
 
 import time
 
+import pytest
+
 from src.common.trace import generate_trace_id, create_leg, parse_leg
 
 
@@ -48,3 +50,7 @@ class TestParseLeg:
         trace_id, epoch = parse_leg("a3f7b2c1:1708099200")
         assert trace_id == "a3f7b2c1"
         assert epoch == 1708099200
+
+    def test_missing_separator_raises(self):
+        with pytest.raises(ValueError):
+            parse_leg("a3f7b2c1")
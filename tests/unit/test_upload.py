@@ -70,3 +70,13 @@ class TestUploadOrders:
         finally:
             for p in zip_paths:
                 os.unlink(p)
+
+    def test_skips_orders_without_zip(self, s3_bucket):
+        upload_orders([{"order_num": "0001", "zip_path": None}], "run-1", "test-internal")
+        resp = s3_bucket.list_objects_v2(Bucket="test-internal")
+        assert resp.get("KeyCount", 0) == 0
+
+    def test_failed_upload_raises(self, s3_bucket):
+        repackaged = [{"order_num": "0001", "zip_path": "/nonexistent/exec.zip"}]
+        with pytest.raises(Exception):
+            upload_orders(repackaged, "run-1", "test-internal")
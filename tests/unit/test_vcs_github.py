@@ -34,6 +34,9 @@ class TestGetComments:
         comments = github.get_comments("org/repo", 42, "token")
         assert len(comments) == 2
         assert comments[0]["id"] == 1
+        headers = responses.calls[0].request.headers
+        assert headers["Accept"] == "application/vnd.github+json"
+        assert headers["Authorization"] == "Bearer token"
 
     @responses.activate
     def test_pagination(self, github):
@@ -57,6 +60,29 @@ class TestGetComments:
         assert len(comments) == 101
         assert len(responses.calls) == 2
 
+    @responses.activate
+    def test_link_header_pages_fetched_in_order(self, github):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        link = f'<{url}?page=2&per_page=100>; rel="next", <{url}?page=3&per_page=100>; rel="last"'
+        responses.add(
+            responses.GET, url,
+            match=[responses.matchers.query_param_matcher({"page": "1", "per_page": "100"})],
+            json=[{"id": i, "body": ""} for i in range(100)],
+            headers={"Link": link},
+            status=200,
+        )
+        for page, ids in ((2, range(100, 200)), (3, [200])):
+            responses.add(
+                responses.GET, url,
+                match=[responses.matchers.query_param_matcher({"page": str(page), "per_page": "100"})],
+                json=[{"id": i, "body": ""} for i in ids],
+                status=200,
+            )
+
+        comments = github.get_comments("org/repo", 42, "token")
+        assert [c["id"] for c in comments] == list(range(201))
+        assert len(responses.calls) == 3
+
     @responses.activate
     def test_empty(self, github):
         responses.add(
@@ -69,6 +95,151 @@ class TestGetComments:
         comments = github.get_comments("org/repo", 42, "token")
         assert comments == []
 
+    @responses.activate
+    def test_retries_gateway_error(self, github):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, json=[{"id": 1, "body": "ok"}], status=200)
+
+        comments = github.get_comments("org/repo", 42, "token")
+        assert [c["id"] for c in comments] == [1]
+        assert len(responses.calls) == 2
+
+
+class TestCommentCache:
+    @responses.activate
+    def test_listing_reused_until_write(self, github):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        responses.add(responses.GET, url, json=[{"id": 1, "body": "a"}], status=200)
+        responses.add(responses.POST, url, json={"id": 2, "body": "b"}, status=201)
+
+        assert [c["id"] for c in github.get_comments("org/repo", 42, "token")] == [1]
+        assert [c["id"] for c in github.get_comments("org/repo", 42, "token")] == [1]
+        assert len(responses.calls) == 1
+
+        github.create_comment("org/repo", 42, "b", "token")
+        github.get_comments("org/repo", 42, "token")
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_unchanged_page_revalidated_with_etag(self, github, monkeypatch):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        responses.add(
+            responses.GET, url,
+            json=[{"id": 1, "body": "a"}],
+            headers={"ETag": '"abc"'},
+            status=200,
+        )
+        responses.add(responses.GET, url, status=304)
+
+        monkeypatch.setattr("src.common.vcs.github.COMMENT_CACHE_TTL", -1)
+        github.get_comments("org/repo", 42, "token")
+        comments = github.get_comments("org/repo", 42, "token")
+
+        assert [c["id"] for c in comments] == [1]
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+
+    @responses.activate
+    def test_page_etags_capped(self, github, monkeypatch):
+        monkeypatch.setattr("src.common.vcs.github.PAGE_ETAG_MAX_ENTRIES", 2)
+        for pr_number in (1, 2, 3):
+            responses.add(
+                responses.GET,
+                f"{GITHUB_API_BASE}/repos/org/repo/issues/{pr_number}/comments",
+                json=[],
+                headers={"ETag": f'"{pr_number}"'},
+                status=200,
+            )
+            github.get_comments("org/repo", pr_number, "token")
+
+        assert [url.rsplit("/", 2)[1] for _, url, _ in github._page_etags] == ["2", "3"]
+
+    @responses.activate
+    def test_write_evicts_page_etags(self, github):
+        for repo, pr_number in (("org/repo", 1), ("org/repo", 2), ("org/other", 1)):
+            url = f"{GITHUB_API_BASE}/repos/{repo}/issues/{pr_number}/comments"
+            responses.add(responses.GET, url, json=[], headers={"ETag": '"x"'}, status=200)
+            github.get_comments(repo, pr_number, "token")
+        responses.add(
+            responses.POST,
+            f"{GITHUB_API_BASE}/repos/org/repo/issues/1/comments",
+            json={"id": 9},
+            status=201,
+        )
+        responses.add(
+            responses.DELETE,
+            f"{GITHUB_API_BASE}/repos/org/repo/issues/comments/9",
+            status=204,
+        )
+
+        github.create_comment("org/repo", 1, "b", "token")
+        assert len(github._page_etags) == 2
+
+        github.delete_comment("org/repo", 9, "token")
+        assert [url for _, url, _ in github._page_etags] == [
+            f"{GITHUB_API_BASE}/repos/org/other/issues/1/comments",
+        ]
+
+    @responses.activate
+    def test_listing_refetched_after_ttl(self, github, monkeypatch):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        responses.add(responses.GET, url, json=[], status=200)
+
+        github.get_comments("org/repo", 42, "token")
+        monkeypatch.setattr("src.common.vcs.github.COMMENT_CACHE_TTL", -1)
+        github.get_comments("org/repo", 42, "token")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_use_cache_false_refetches(self, github):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        responses.add(responses.GET, url, json=[], status=200)
+
+        github.get_comments("org/repo", 42, "token")
+        github.get_comments("org/repo", 42, "token", use_cache=False)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_caches_scoped_to_token(self, github):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        responses.add(
+            responses.GET, url,
+            json=[{"id": 1, "body": "a"}],
+            headers={"ETag": '"abc"'},
+            status=200,
+        )
+
+        github.get_comments("org/repo", 42, "token-a")
+        github.get_comments("org/repo", 42, "token-b")
+
+        # The second token neither reuses the listing nor revalidates the page
+        assert len(responses.calls) == 2
+        assert "If-None-Match" not in responses.calls[1].request.headers
+        assert all("token-a" not in key for key in github._comment_cache)
+
+    def test_expired_entries_dropped(self, github, monkeypatch):
+        github._store_comments("org/repo", 1, "token", [])
+        monkeypatch.setattr("src.common.vcs.github.COMMENT_CACHE_TTL", -1)
+
+        assert github._cached_comments("org/repo", 1, "token") is None
+        assert not github._comment_cache
+
+        github._store_comments("org/repo", 2, "token", [])
+        github._store_comments("org/repo", 3, "token", [])
+        assert [key[1:] for key in github._comment_cache] == [("org/repo", 3)]
+
+    def test_entries_capped(self, github, monkeypatch):
+        monkeypatch.setattr("src.common.vcs.github.COMMENT_CACHE_MAX_ENTRIES", 2)
+        github._store_comments("org/repo", 1, "token", [])
+        github._store_comments("org/repo", 2, "token", [])
+        github._cached_comments("org/repo", 1, "token")
+        github._store_comments("org/repo", 3, "token", [])
+
+        assert [key[1:] for key in github._comment_cache] == [
+            ("org/repo", 1), ("org/repo", 3),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # CRUD
@@ -91,6 +262,7 @@ class TestCreateComment:
         req = responses.calls[0].request
         assert "Bearer token123" in req.headers["Authorization"]
         assert json.loads(req.body)["body"] == "test comment"
+        assert req.headers["Content-Type"] == "application/json"
 
 
 class TestUpdateComment:
@@ -163,3 +335,52 @@ class TestFindCommentByTag:
             status=200,
         )
         assert github.find_comment_by_tag("org/repo", 42, "#missing", "token") is None
+
+    @responses.activate
+    def test_ignores_cached_listing(self, github):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        responses.add(responses.GET, url, json=[], status=200)
+        responses.add(responses.POST, f"{GITHUB_API_BASE}/graphql", status=502)
+        responses.add(
+            responses.GET, url,
+            json=[{"id": 3, "body": "posted elsewhere #tag-123"}],
+            status=200,
+        )
+
+        github.get_comments("org/repo", 42, "token")
+        assert github.find_comment_by_tag("org/repo", 42, "#tag-123", "token") == 3
+
+    @responses.activate
+    def test_graphql_match_skips_rest(self, github):
+        responses.add(
+            responses.POST,
+            f"{GITHUB_API_BASE}/graphql",
+            json={"data": {"repository": {"issueOrPullRequest": {"comments": {
+                "nodes": [
+                    {"databaseId": 1, "body": "unrelated"},
+                    {"databaseId": 2, "body": "has #tag-123"},
+                ],
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            }}}}},
+            status=200,
+        )
+        assert github.find_comment_by_tag("org/repo", 42, "#tag-123", "token") == 2
+        assert len(responses.calls) == 1
+        variables = json.loads(responses.calls[0].request.body)["variables"]
+        assert variables == {"owner": "org", "name": "repo", "number": 42, "cursor": None}
+
+    @responses.activate
+    def test_graphql_error_falls_back_to_rest(self, github):
+        responses.add(
+            responses.POST,
+            f"{GITHUB_API_BASE}/graphql",
+            json={"errors": [{"message": "Resource not accessible by integration"}]},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments",
+            json=[{"id": 7, "body": "has #tag-123"}],
+            status=200,
+        )
+        assert github.find_comment_by_tag("org/repo", 42, "#tag-123", "token") == 7
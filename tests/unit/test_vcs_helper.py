@@ -5,10 +5,19 @@ import json
 import pytest
 import responses
 
+from src.common.vcs import helper
 from src.common.vcs.helper import VcsHelper
 from src.common.vcs.github import GITHUB_API_BASE
 
 
+@pytest.fixture(autouse=True)
+def fresh_providers():
+    """Each test gets new provider instances (and empty comment caches)."""
+    helper._provider_instances.clear()
+    yield
+    helper._provider_instances.clear()
+
+
 @pytest.fixture
 def vcs():
     return VcsHelper(provider="github")
@@ -29,6 +38,9 @@ class TestVcsHelperInit:
         with pytest.raises(ValueError, match="Unknown VCS provider 'bitbucket'"):
             VcsHelper(provider="bitbucket")
 
+    def test_provider_shared_across_helpers(self):
+        assert VcsHelper(provider="github").provider is VcsHelper().provider
+
     def test_default_is_github(self):
         vcs = VcsHelper()
         from src.common.vcs.github import GitHubProvider
@@ -86,6 +98,11 @@ class TestHasTagBlockAtLastLine:
     def test_empty_body(self):
         assert VcsHelper.has_tag_block_at_last_line("", "my-run") is False
 
+    def test_search_str_is_literal(self):
+        body = "Status\n###run.1+x### #deploy"
+        assert VcsHelper.has_tag_block_at_last_line(body, "run.1+x", ["deploy"]) is True
+        assert VcsHelper.has_tag_block_at_last_line(body, "run.1.x") is False
+
 
 # ---------------------------------------------------------------------------
 # search_comments — last-line tag block search
@@ -230,6 +247,28 @@ class TestUpsertComment:
         assert "New deploy report" in updated_body
         assert updated_body.endswith("###my-run### #deploy")
 
+    @responses.activate
+    def test_search_ignores_cached_listing(self, vcs):
+        url = f"{GITHUB_API_BASE}/repos/org/repo/issues/42/comments"
+        responses.add(responses.GET, url, json=[], status=200)
+        # Another container posted the managed comment after the first listing
+        responses.add(
+            responses.GET, url,
+            json=[{"id": 100, "body": "Old\n\n###my-run###"}],
+            status=200,
+        )
+        responses.add(
+            responses.PATCH,
+            f"{GITHUB_API_BASE}/repos/org/repo/issues/comments/100",
+            json={"id": 100},
+            status=200,
+        )
+
+        vcs.get_comments("org/repo", 42, "token")
+        result = vcs.upsert_comment("org/repo", 42, "my-run", "New", [], "token")
+
+        assert result == {"id": 100, "status": True, "action": "updated"}
+
     @responses.activate
     def test_upsert_with_multiple_tags(self, vcs):
         responses.add(
@@ -1,7 +1,9 @@
 """Unit tests for src/worker/run.py."""
 
+import io
 import json
 import os
+import shutil
 import tempfile
 import zipfile
 from unittest.mock import patch, MagicMock, call
@@ -70,6 +72,25 @@ class TestExecuteCommands:
             assert "error_msg" in log
 
 
+class TestDownloadAndExtract:
+    @patch("src.common.code_source.get_client")
+    def test_extracts_without_writing_zip(self, mock_get_client):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("run.sh", "echo hi")
+        mock_get_client.return_value.download_fileobj.side_effect = (
+            lambda bucket, key, fileobj, Config=None: fileobj.write(buf.getvalue())
+        )
+
+        work_dir = _download_and_extract("s3://bucket/run-1/0001/exec.zip")
+        try:
+            assert os.listdir(work_dir) == ["run.sh"]
+            args = mock_get_client.return_value.download_fileobj.call_args.args
+            assert args[:2] == ("bucket", "run-1/0001/exec.zip")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
 class TestSetupEventsDir:
     def test_creates_directory(self):
         with tempfile.TemporaryDirectory() as base: